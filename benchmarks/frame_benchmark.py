@@ -0,0 +1,262 @@
+"""
+Frame time benchmark.
+
+Runs the game headless (SDL dummy video and audio drivers) and drives it with
+scripted input instead of a player: NPC clicks, moves, back, reset and full
+autosolves. Frames are not capped by clock.tick, and every frame's
+handle_events, update and draw are timed separately. The report holds their
+p50/p95/p99 per scenario, is written as JSON and, when a baseline exists,
+compared against it; any regression makes the script exit with a non-zero status.
+
+Usage (from the repository root):
+    python -m benchmarks.frame_benchmark                         # run and compare with the baseline
+    python -m benchmarks.frame_benchmark --save-baseline         # run and store the result as the new baseline
+    python -m benchmarks.frame_benchmark --frames 600 --scenarios autosolve --full-redraw
+"""
+import argparse
+import contextlib
+import os
+import platform
+import sys
+import time
+from typing import Dict, Iterator, List
+
+import pygame as pg
+
+from benchmarks.solver_benchmark import load_json, write_json
+from src import settings
+from src.enums import NPCType
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "frame_baseline.json")
+DEFAULT_REPORT = os.path.join(BENCHMARK_DIR, "frame_report.json")
+
+PHASES = ("handle_events", "update", "draw", "frame")
+PERCENTILES = (50, 95, 99)
+
+# Percentiles below this are mostly noise and are not compared
+MIN_COMPARED_TIME = 0.0005
+
+# Frames at least between two scripted inputs, so each one's effect gets drawn
+STEP_FRAMES = 5
+
+# The classic 11-crossing solution, as (missionaries, cannibals) on each trip
+CROSSINGS = [(0, 2), (0, 1), (0, 2), (0, 1), (2, 0), (1, 1), (2, 0), (0, 1), (0, 2), (0, 1), (0, 2)]
+
+
+def click(pos) -> List[pg.event.Event]:
+    return [pg.event.Event(pg.MOUSEBUTTONDOWN, button=1, pos=pos)]
+
+
+def board(game, npc_type: NPCType) -> List[pg.event.Event]:
+    """
+    Click an NPC of the given type waiting on the boat's shore.
+    """
+    for npc in game.npc_sprites:
+        if npc.npc_type == npc_type and npc.shore == game.boat.current_shore and npc not in game.boat.passengers:
+            return click(npc.rect.center)
+    return []
+
+
+def idle_script(game) -> Iterator[List[pg.event.Event]]:
+    while True:
+        yield []
+
+
+def play_script(game) -> Iterator[List[pg.event.Event]]:
+    """
+    Play the puzzle by hand: each crossing boards its NPCs and moves, and
+    every third crossing is undone with Back and played again. Ends in a reset.
+    """
+    while True:
+        for trip, (missionaries, cannibals) in enumerate(CROSSINGS):
+            for attempt in range(2 if trip % 3 == 2 else 1):
+                for npc_type, count in ((NPCType.MISSIONARY, missionaries), (NPCType.CANNIBAL, cannibals)):
+                    for _ in range(count):
+                        yield board(game, npc_type)
+                        yield from settle(game)
+                yield click(game.move_button.rect.center)
+                yield from settle(game)
+                if attempt == 0 and trip % 3 == 2:
+                    yield click(game.back_button.rect.center)
+                    yield from settle(game)
+        yield click(game.reset_button.rect.center)
+        yield from settle(game)
+
+
+def autosolve_script(game) -> Iterator[List[pg.event.Event]]:
+    """
+    Press Solve and watch the solution play out, over and over.
+    """
+    while True:
+        yield click(game.solve_button.rect.center)
+        while game.auto_solving:
+            yield []
+        yield click(game.reset_button.rect.center)
+        yield from idle_frames(STEP_FRAMES)
+
+
+def idle_frames(count: int) -> Iterator[List[pg.event.Event]]:
+    for _ in range(count):
+        yield []
+
+
+def settle(game) -> Iterator[List[pg.event.Event]]:
+    """
+    Wait a few frames and until nothing glides anymore, like a player would
+    before clicking again.
+    """
+    yield from idle_frames(STEP_FRAMES)
+    while len(game.tweens):
+        yield []
+
+
+SCENARIOS = {
+    "idle": idle_script,
+    "play": play_script,
+    "autosolve": autosolve_script,
+}
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(samples: List[float]) -> Dict:
+    ordered = sorted(samples)
+    summary = {f"p{percent}": percentile(ordered, percent) for percent in PERCENTILES}
+    summary["mean"] = sum(ordered) / len(ordered)
+    return summary
+
+
+def run_scenario(name: str, frames: int, warmup: int, autosolve_delay: int, prebake: bool) -> Dict:
+    from src.game import Game
+
+    samples = {phase: [] for phase in PHASES}
+    # The game narrates every click and move on stdout
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        game = Game(headless=True)
+        game.autosolve_delay = autosolve_delay
+        if prebake and game.map.animation_frames:
+            game.map.prebake()
+
+        script = SCENARIOS[name](game)
+        for frame in range(warmup + frames):
+            for event in next(script):
+                pg.event.post(event)
+
+            start = time.perf_counter()
+            game.handle_events()
+            handled = time.perf_counter()
+            game.update()
+            updated = time.perf_counter()
+            game.draw()
+            drawn = time.perf_counter()
+
+            if frame >= warmup:
+                samples["handle_events"].append(handled - start)
+                samples["update"].append(updated - handled)
+                samples["draw"].append(drawn - updated)
+                samples["frame"].append(drawn - start)
+
+        game.reset_game()  # Cancels a solve that is still running
+
+    return {phase: summarize(values) for phase, values in samples.items()}
+
+
+def run_suite(scenarios: List[str], frames: int, warmup: int, autosolve_delay: int, prebake: bool) -> Dict:
+    results = {}
+    for name in scenarios:
+        result = run_scenario(name, frames, warmup, autosolve_delay, prebake)
+        results[name] = result
+        for phase in PHASES:
+            summary = result[phase]
+            print(f"{name:>10} {phase:>14}  " + "  ".join(
+                f"p{percent} {summary[f'p{percent}'] * 1000:8.3f} ms" for percent in PERCENTILES), file=sys.stderr)
+    pg.quit()
+
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "pygame": pg.version.ver,
+        "dirty_rendering": settings.DIRTY_RENDERING,
+        "frames": frames,
+        "results": results,
+    }
+
+
+def compare(report: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Regressions of the report against the baseline, as human readable lines.
+    Every phase's p50 and p95 may grow by `tolerance`; p99 is too noisy to compare.
+    """
+    regressions = []
+    for name, result in report["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        for phase in PHASES:
+            for metric in ("p50", "p95"):
+                before, after = old[phase][metric], result[phase][metric]
+                if not before or after < MIN_COMPARED_TIME:
+                    continue
+                if after > before * (1 + tolerance):
+                    regressions.append(f"{name} {phase} {metric}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms "
+                                       f"(+{(after / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark frame times of the game driven by scripted input.")
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--frames", type=int, default=1000, help="Measured frames per scenario")
+    parser.add_argument("--warmup", type=int, default=30, help="Frames run before measuring")
+    parser.add_argument("--autosolve-delay", type=int, default=0,
+                        help="Milliseconds between autosolve moves (the game uses 500)")
+    parser.add_argument("--cold", action="store_true",
+                        help="Do not pre-render the river animation, so its first loop is measured too")
+    parser.add_argument("--full-redraw", action="store_true",
+                        help="Redraw and flip the whole screen every frame instead of dirty rectangles")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="Allowed relative growth before a metric counts as a regression")
+    parser.add_argument("--report", default=DEFAULT_REPORT)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    if args.full_redraw:
+        settings.DIRTY_RENDERING = False
+    report = run_suite(args.scenarios, args.frames, args.warmup, args.autosolve_delay, not args.cold)
+    write_json(args.report, report)
+    print(f"Report written to {args.report}", file=sys.stderr)
+
+    if args.save_baseline:
+        write_json(args.baseline, report)
+        print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+        return 0
+
+    baseline = load_json(args.baseline)
+    if baseline is None:
+        print("No baseline to compare against, run with --save-baseline to create one.", file=sys.stderr)
+        return 0
+    if baseline.get("dirty_rendering") != report["dirty_rendering"]:
+        print("The baseline was recorded with the other rendering mode, not comparing.", file=sys.stderr)
+        return 0
+
+    regressions = compare(report, baseline, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} regression(s) against {args.baseline}:", file=sys.stderr)
+        for line in regressions:
+            print(f"  {line}", file=sys.stderr)
+        return 1
+
+    print("No regressions against the baseline.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""
+Solver benchmark suite.
+
+Runs every solver strategy over a ladder of instance sizes and records wall time,
+nodes expanded per second, peak traced memory and solution length. The report is
+written as JSON and, when a baseline exists, compared against it; any regression
+makes the script exit with a non-zero status.
+
+Usage (from the repository root):
+    python -m benchmarks.solver_benchmark                      # run and compare with the baseline
+    python -m benchmarks.solver_benchmark --save-baseline      # run and store the result as the new baseline
+    python -m benchmarks.solver_benchmark --max-people 500 --strategies bfs astar
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from src.entities.puzzle import Puzzle
+from src.entities.state import State
+from src.enums import SolverStrategy
+from src.solver import SearchStats, Solver
+from src.vectorized_solver import VectorizedSolver
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+DEFAULT_REPORT = os.path.join(BENCHMARK_DIR, "report.json")
+
+# (missionaries, cannibals, boat capacity), smallest first
+LADDER = [
+    (3, 3, 2),
+    (5, 5, 3),
+    (20, 20, 4),
+    (100, 100, 4),
+    (150, 100, 5),
+    (300, 200, 6),
+    (1000, 1000, 4),
+    (5000, 5000, 5),
+]
+
+# Timings below this are mostly noise and are not compared
+MIN_COMPARED_TIME = 0.02
+
+# IDA* keeps no visited set and re-expands states, so it only gets the small rungs
+MAX_PEOPLE = {
+    SolverStrategy.IDASTAR: 5,
+}
+
+
+def instance_name(m: int, c: int, k: int) -> str:
+    return f"{m}/{c}/{k}"
+
+
+def run_once(puzzle: Puzzle, strategy: SolverStrategy, trace_memory: bool) -> Dict:
+    # Every run pays for its own distance table so the table strategy is comparable
+    Solver.clear_distance_tables()
+    gc.collect()
+
+    stats = SearchStats()
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    path = Solver.solve_from_state(State.from_puzzle(puzzle), stats, strategy)
+    wall_time = time.perf_counter() - start
+    peak_memory = None
+    if trace_memory:
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "wall_time": wall_time,
+        "nodes_expanded": stats.nodes_expanded,
+        "nodes_generated": stats.nodes_generated,
+        "duplicates_pruned": stats.duplicates_pruned,
+        "invalid_rejected": stats.invalid_rejected,
+        "peak_frontier": stats.peak_frontier,
+        "slowest_layer": max(stats.layer_times, default=None),
+        "path_length": len(path) - 1 if path else None,
+        "peak_memory": peak_memory,
+    }
+
+
+def benchmark(strategy: SolverStrategy, puzzle: Puzzle, repeat: int) -> Dict:
+    """
+    Best wall time of `repeat` untraced runs plus one traced run for peak memory,
+    since tracemalloc slows allocation-heavy code down considerably.
+    """
+    runs = [run_once(puzzle, strategy, trace_memory=False) for _ in range(repeat)]
+    best = min(runs, key=lambda run: run["wall_time"])
+    best["peak_memory"] = run_once(puzzle, strategy, trace_memory=True)["peak_memory"]
+    best["nodes_per_second"] = best["nodes_expanded"] / best["wall_time"] if best["wall_time"] else None
+    return best
+
+
+def run_suite(strategies: List[SolverStrategy], max_people: int, repeat: int) -> Dict:
+    results = {}
+    for strategy in strategies:
+        if strategy == SolverStrategy.VECTORIZED and not VectorizedSolver.is_available():
+            print(f"Skipping {strategy.value}: numpy is not installed", file=sys.stderr)
+            continue
+
+        limit = min(max_people, MAX_PEOPLE.get(strategy, max_people))
+        results[strategy.value] = {}
+        for m, c, k in LADDER:
+            if max(m, c) > limit:
+                continue
+            name = instance_name(m, c, k)
+            result = benchmark(strategy, Puzzle(m, c, k), repeat)
+            results[strategy.value][name] = result
+            print(f"{strategy.value:>14} {name:>14}  {result['wall_time'] * 1000:10.2f} ms  "
+                  f"{result['nodes_expanded']:>9} nodes  {result['peak_memory'] / 1024:10.1f} KiB  "
+                  f"length {result['path_length']}", file=sys.stderr)
+
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(report: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Regressions of the report against the baseline, as human readable lines.
+    Path lengths must match exactly; time, node counts and memory may grow by `tolerance`.
+    """
+    regressions = []
+    for strategy, instances in report["results"].items():
+        for name, result in instances.items():
+            old = baseline["results"].get(strategy, {}).get(name)
+            if old is None:
+                continue
+
+            label = f"{strategy} {name}"
+            if result["path_length"] != old["path_length"]:
+                regressions.append(f"{label}: path length {old['path_length']} -> {result['path_length']}")
+
+            for metric in ("wall_time", "nodes_expanded", "peak_memory"):
+                before, after = old.get(metric), result.get(metric)
+                if not before or after is None:
+                    continue
+                if metric == "wall_time" and after < MIN_COMPARED_TIME:
+                    continue
+                if after > before * (1 + tolerance):
+                    regressions.append(f"{label}: {metric} {before:.6g} -> {after:.6g} "
+                                       f"(+{(after / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def load_json(path: str) -> Optional[Dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_json(path: str, data: Dict):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark solver strategies over growing instances.")
+    parser.add_argument("--strategies", nargs="+", default=[strategy.value for strategy in SolverStrategy],
+                        choices=[strategy.value for strategy in SolverStrategy])
+    parser.add_argument("--max-people", type=int, default=max(max(m, c) for m, c, _ in LADDER),
+                        help="Skip rungs with more people per side than this")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per instance, the best one is kept")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative growth before a metric counts as a regression")
+    parser.add_argument("--report", default=DEFAULT_REPORT)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    strategies = [SolverStrategy(strategy) for strategy in args.strategies]
+    report = run_suite(strategies, args.max_people, args.repeat)
+    write_json(args.report, report)
+    print(f"Report written to {args.report}", file=sys.stderr)
+
+    if args.save_baseline:
+        write_json(args.baseline, report)
+        print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+        return 0
+
+    baseline = load_json(args.baseline)
+    if baseline is None:
+        print("No baseline to compare against, run with --save-baseline to create one.", file=sys.stderr)
+        return 0
+
+    regressions = compare(report, baseline, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} regression(s) against {args.baseline}:", file=sys.stderr)
+        for line in regressions:
+            print(f"  {line}", file=sys.stderr)
+        return 1
+
+    print("No regressions against the baseline.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,10 +5,17 @@ from src.enums import Shores
 from src.entities.npc import NPC
 
 
-class Boat(pygame.sprite.Sprite):
+class Boat(pygame.sprite.DirtySprite):
     def __init__(self, left_pos: Tuple[int, int], right_pos: Tuple[int, int], start_pos: int,
-                 dimensions: Tuple[int, int], start_shore: Shores = Shores.LEFT):
+                 dimensions: Tuple[int, int], start_shore: Shores = Shores.LEFT, capacity: int = 2,
+                 tweens=None):
+        """
+        With a TweenScheduler in tweens, the boat and its passengers glide
+        across instead of teleporting.
+        """
         super().__init__()
+        self.tweens = tweens
+        self.capacity = capacity
         self.start_pos = start_pos
         self.left_pos = left_pos
         self.right_pos = right_pos
@@ -31,18 +38,14 @@ class Boat(pygame.sprite.Sprite):
 
     def _rearrange_passengers(self):
         """
-        Rearranges passengers in the boat to maintain order.
-        This is a placeholder for future logic if needed.
+        Close the gaps left by passengers who got off, keeping boarding order.
         """
         boat_size = len(self.passengers)
         if boat_size > 0:
-            self.passengers = sorted(self.passengers)
-
             for i, passenger in enumerate(self.passengers, 0):
                 # Update passenger position based on their index in the boat
                 print(f"Moving {passenger} to position {i}")
-                passenger.move((self.rect.left + self.rect.width // 2 * i,
-                                self.rect.top - passenger.dimensions[1]))
+                passenger.move(self._seat(i, passenger))
 
 
     def add_passenger(self, passenger: NPC):
@@ -55,12 +58,11 @@ class Boat(pygame.sprite.Sprite):
             return False
 
         boat_size = len(self.passengers)
-        if boat_size < 2:
+        if boat_size < self.capacity:
             self.passengers.append(passenger)
 
             # Move passenger to the boat's position
-            passenger.move((self.rect.left + self.rect.width // 2 * boat_size,
-                            self.rect.top - passenger.dimensions[1]))
+            passenger.move(self._seat(boat_size, passenger))
 
             return True
 
@@ -80,6 +82,22 @@ class Boat(pygame.sprite.Sprite):
 
         return False
 
+    def _seat(self, index: int, passenger: NPC) -> Tuple[int, int]:
+        """
+        Where a passenger sits, from where the boat is docked rather than
+        where it is drawn, which differs while it glides.
+        """
+        left, top = self.left_pos if self.current_shore == Shores.LEFT else self.right_pos
+        return left + self.rect.width // self.capacity * index, top - passenger.dimensions[1]
+
+    def unload(self):
+        """
+        Put every passenger back ashore on the boat's current shore.
+        """
+        for passenger in self.passengers:
+            passenger.get_down(self.current_shore)
+        self.passengers.clear()
+
     def _create_image(self, dimensions: Tuple[int, int]) -> Surface:
         """
         Creates the boat surface with a simple rectangle and wooden texture.
@@ -110,9 +128,16 @@ class Boat(pygame.sprite.Sprite):
         Sets the boat position to LEFT, MIDDLE, or RIGHT.
         """
         if position == Shores.LEFT:
-            self.rect.topleft = self.left_pos
+            target = self.left_pos
         elif position == Shores.RIGHT:
-            self.rect.topleft = self.right_pos
+            target = self.right_pos
+        else:
+            return
+        if self.tweens is not None:
+            self.tweens.move(self, target)
+            return
+        self.rect.topleft = target
+        self.dirty = 1
 
     def move(self):
         """
@@ -127,8 +152,9 @@ class Boat(pygame.sprite.Sprite):
 
         self.set_position(self.current_shore)
 
-        # Move passengers to the new shore
-        for passenger in self.passengers:
+        # Passengers ride across, then step ashore
+        for i, passenger in enumerate(self.passengers):
+            passenger.move(self._seat(i, passenger))
             passenger.get_down(self.current_shore)
 
         self.passengers.clear()
@@ -1,13 +1,37 @@
-from typing import Tuple
+from typing import Optional, Tuple
+from pygame import Rect
 from pygame.sprite import Sprite
 from pygame.surface import Surface
 from pygame import gfxdraw
 import math
 import random
+try:
+    import numpy as np
+    from pygame import surfarray
+except ImportError:  # Without numpy cached frames keep their full color depth
+    np = None
+from src.entities.vectorized_river import VectorizedRiver
 
 class Map(Sprite):
     def __init__(self, size: Tuple[int, int], land_color, water_color, shore_color,
-                 river_width=80, shore_width=20, wavy_frequency=1, wavy_amplitude=100):
+                 river_width=80, shore_width=20, wavy_frequency=1, wavy_amplitude=100,
+                 animation_frames=0, cache_size: Optional[int] = None, vectorized=False):
+        """
+        vectorized draws the river with NumPy into a reused pixel buffer
+        instead of gfxdraw polygons (see VectorizedRiver).
+
+        With animation_frames > 0 the river loops over that many pre-rendered
+        frames instead of being redrawn every update. Only the two strips around
+        the banks change between frames, so only those are rendered and cached,
+        as 8-bit palettized strips when NumPy is available (a frame never uses
+        more than a few hundred colors), and blitted onto one reused image.
+        The first cache_size frames rendered (all of them by default) are kept
+        and the others redrawn whenever they are shown: the loop visits frames
+        in order, so evicting old ones would only drop each right before its turn.
+
+        After each update changed_rects lists the screen areas that differ
+        from the previous image, for dirty-rectangle rendering.
+        """
         super().__init__()
         self.counter = 0
 
@@ -28,14 +52,120 @@ class Map(Sprite):
         self.water_color = water_color
         self.shore_color = shore_color
 
+        self._vectorized_river = VectorizedRiver(self) if vectorized else None
         self.image = self._generate_landscape()
         self.rect = self.image.get_rect()
+        self.changed_rects = []
+
+        self.animation_frames = animation_frames
+        if animation_frames:
+            # River waves repeat every 2*pi*f steps and shore waves every 2*pi*0.8f,
+            # so the whole picture repeats exactly after 8*pi*f steps
+            self.period = 8 * math.pi * wavy_frequency
+            self.cache_size = cache_size if cache_size is not None else animation_frames
+            self._frames = {}
+            self._frame_index = None
+            self._scratch = Surface(self.size)
+            if np is not None:
+                # Mapped colors of the 8-bit strips, sorted; edge blends join as they show up
+                self._palette = np.unique([self._scratch.map_rgb(color)
+                                           for color in (land_color, water_color, shore_color)]).astype(np.uint32)
+                self._palette_colors = [self._scratch.unmap_rgb(int(color)) for color in self._palette]
+            self._strips = self.animated_strips()
+            self._show_frame(0)
+
+    def animated_strips(self) -> Tuple[Rect, Rect]:
+        """
+        Columns that can change between frames: each river edge plus its shore.
+        Everything between them is always water and everything outside always land.
+        """
+        center = self.size[0] // 2
+        river_reach = int(self.wavy_amplitude * 1.2) + 2
+        shore_reach = self.shore_width + int(self.shore_amplitude) + 1
+        left_edge = center - self.river_width // 2
+        right_edge = center + self.river_width // 2
+        height = self.size[1]
+        left = Rect(left_edge - river_reach - shore_reach, 0, 2 * river_reach + shore_reach, height)
+        right = Rect(right_edge - river_reach, 0, 2 * river_reach + shore_reach, height)
+        bounds = Rect((0, 0), self.size)
+        return left.clip(bounds), right.clip(bounds)
+
+    def _render_frame(self, index: int):
+        self.counter = index * self.period / self.animation_frames
+        if self._vectorized_river is not None:
+            # After its first frame on a surface it only rewrites the strips
+            self._vectorized_river.render(self._scratch)
+        else:
+            self._draw_strips(self._scratch)
+        return tuple(self._compact(self._scratch.subsurface(rect)) for rect in self._strips)
+
+    def _compact(self, strip: Surface) -> Surface:
+        """
+        Copy of the strip as an 8-bit surface, a quarter of the memory. Every
+        frame indexes into one shared palette of the exact colors seen so far;
+        strips are copied at full depth when NumPy is missing or the palette is full.
+        """
+        if np is None:
+            return strip.copy()
+        pixels = surfarray.pixels2d(strip)
+        indices = np.searchsorted(self._palette, pixels)
+        known = self._palette[np.minimum(indices, len(self._palette) - 1)] == pixels
+        if not known.all():
+            palette = np.union1d(self._palette, pixels[~known])
+            if len(palette) > 256:
+                del pixels
+                return strip.copy()
+            self._palette = palette
+            self._palette_colors = [strip.unmap_rgb(int(color)) for color in palette]
+            indices = np.searchsorted(palette, pixels)
+        del pixels  # Unlocks the strip
+
+        compact = Surface(strip.get_size(), 0, 8)
+        compact.set_palette(self._palette_colors)
+        surfarray.blit_array(compact, indices.astype(np.uint8))
+        return compact
+
+    def _show_frame(self, index: int) -> bool:
+        if index == self._frame_index:
+            return False
+        self._frame_index = index
+
+        strips = self._frames.get(index)
+        if strips is None:
+            counter = self.counter
+            strips = self._render_frame(index)
+            self.counter = counter
+            if len(self._frames) < self.cache_size:
+                self._frames[index] = strips
+
+        for strip, rect in zip(strips, self._strips):
+            self.image.blit(strip, rect)
+        return True
+
+    def prebake(self):
+        """
+        Render every animation frame up front (up to the cache size) so the
+        first loop does not pay for rendering either.
+        """
+        if not self.animation_frames:
+            return
+        counter = self.counter
+        for index in range(min(self.animation_frames, self.cache_size)):
+            if index not in self._frames and len(self._frames) < self.cache_size:
+                self._frames[index] = self._render_frame(index)
+        self.counter = counter
 
     def _generate_landscape(self) -> Surface:
         surface = Surface(self.size)
+        self._draw_landscape(surface)
+        return surface
+
+    def _draw_landscape(self, surface):
+        if self._vectorized_river is not None:
+            self._vectorized_river.render(surface)
+            return
         surface.fill(self.land_color)
         self._generate_river(surface)
-        return surface
 
     def _generate_river(self, surface):
         left_edge = self._wavy_line_left()
@@ -59,6 +189,31 @@ class Map(Sprite):
         gfxdraw.aapolygon(surface, right_shore_polygon, self.shore_color)
         gfxdraw.filled_polygon(surface, right_shore_polygon, self.shore_color)
 
+    def _draw_strips(self, surface):
+        """
+        Draw only the animated strips, each with the polygons of its own bank.
+        The river polygon is cut just past the strip, so half of it is filled
+        per bank instead of all of it twice; inside the strip nothing changes.
+        """
+        left_edge = self._wavy_line_left()
+        right_edge = self._wavy_line_right()
+        left_strip, right_strip = self._strips
+        top, bottom = left_edge[0][1], left_edge[-1][1]
+        banks = (
+            (left_strip, left_edge + [(left_strip.right, bottom), (left_strip.right, top)],
+             left_edge + self._generate_independent_shore(left_edge, self.shore_phase_offset_left)[::-1]),
+            (right_strip, [(right_strip.left - 1, top), (right_strip.left - 1, bottom)] + right_edge[::-1],
+             right_edge + self._generate_independent_shore(right_edge, self.shore_phase_offset_right)[::-1]),
+        )
+        for rect, river_polygon, shore_polygon in banks:
+            surface.set_clip(rect)
+            surface.fill(self.land_color)
+            gfxdraw.filled_polygon(surface, river_polygon, self.water_color)
+            gfxdraw.aapolygon(surface, river_polygon, self.water_color)
+            gfxdraw.aapolygon(surface, shore_polygon, self.shore_color)
+            gfxdraw.filled_polygon(surface, shore_polygon, self.shore_color)
+        surface.set_clip(None)
+
     def _generate_independent_shore(self, edge_points, phase_offset):
         """
         Generate shore edge with its own wavy movement, independent from the river.
@@ -85,6 +240,21 @@ class Map(Sprite):
             points.append((x + horizontal_offset, y))
         return points
 
-    def update(self, *args, **kwargs):
-        self.counter = (self.counter + 2) % 10000
-        self.image = self._generate_landscape()
+    def update(self, steps: int = 1):
+        """
+        Advance the river by the given number of simulation steps.
+        """
+        if steps == 0:
+            self.changed_rects = []
+            return
+        if self.animation_frames:
+            self.counter = (self.counter + 2 * steps) % self.period
+            changed = self._show_frame(int(self.counter * self.animation_frames / self.period) % self.animation_frames)
+            self.changed_rects = list(self._strips) if changed else []
+            return
+        self.counter = (self.counter + 2 * steps) % 10000
+        self.changed_rects = list(self.animated_strips())
+        if self._vectorized_river is not None:
+            self._vectorized_river.render(self.image)
+        else:
+            self.image = self._generate_landscape()
@@ -1,16 +1,23 @@
 from typing import Tuple
 from src.enums import Shores
-from pygame.sprite import Sprite
+from pygame.sprite import DirtySprite
 from pygame.surface import Surface
 from pygame import gfxdraw
 import pygame as pg
 from src.enums import NPCType, MissionaryColors, CannibalColors
 
 
-class NPC(Sprite):
+class NPC(DirtySprite):
+    # One pre-rendered figure per (type, size), shared by every NPC that looks the same
+    _images = {}
+
     def __init__(self, right_shore_pos, left_shore_pos, dimensions: Tuple[float, float],
-                 npc_type: NPCType, start_shore: Shores, screen: Surface):
+                 npc_type: NPCType, start_shore: Shores, screen: Surface, tweens=None):
+        """
+        With a TweenScheduler in tweens, moves glide instead of teleporting.
+        """
         super().__init__()
+        self.tweens = tweens
         self.dimensions = dimensions
         self.screen = screen
         self.npc_type = npc_type
@@ -42,6 +49,18 @@ class NPC(Sprite):
         self.move(pos)
 
     def _create_image(self) -> Surface:
+        """
+        Get the shared figure for this type and size, drawing it the first time.
+        The surface is shared between instances, so it must never be drawn on.
+        """
+        key = (self.npc_type, tuple(self.dimensions))
+        image = NPC._images.get(key)
+        if image is None:
+            image = self._draw_image()
+            NPC._images[key] = image
+        return image
+
+    def _draw_image(self) -> Surface:
         """
         Create an image with more detailed shapes and antialiasing.
         """
@@ -60,7 +79,11 @@ class NPC(Sprite):
         """
         Move the NPC to the specified coordinates.
         """
+        if self.tweens is not None:
+            self.tweens.move(self, coords)
+            return
         self.rect.topleft = coords
+        self.dirty = 1
 
     def reset_position(self):
         """
@@ -0,0 +1,127 @@
+from typing import List, Tuple
+from src.enums import Shores
+
+
+class Puzzle:
+    """
+    Definition of a missionaries and cannibals instance.
+
+    Holds how many people of each kind there are, how many seats the boat has
+    and which shores the crossing starts and ends on. States and the solver read
+    every size from here instead of assuming the classic 3/3/2 instance.
+    """
+
+    def __init__(self, missionaries: int = 3, cannibals: int = 3, boat_capacity: int = 2,
+                 start_shore: Shores = Shores.LEFT, goal_shore: Shores = Shores.RIGHT):
+        if missionaries < 0 or cannibals < 0:
+            raise ValueError("People per side cannot be negative.")
+        if boat_capacity < 1:
+            raise ValueError("The boat needs at least one seat.")
+
+        self.missionaries = missionaries
+        self.cannibals = cannibals
+        self.boat_capacity = boat_capacity
+        self.start_shore = start_shore
+        self.goal_shore = goal_shore
+
+        self.boat_loads = self._generate_boat_loads()
+
+    def _generate_boat_loads(self) -> List[Tuple[int, int]]:
+        """
+        Every (missionaries, cannibals) load the boat can carry in one trip.
+        Grows with the boat capacity, not with the number of people.
+        """
+        loads = []
+        for m in range(min(self.boat_capacity, self.missionaries) + 1):
+            for c in range(min(self.boat_capacity - m, self.cannibals) + 1):
+                if m + c == 0:
+                    continue
+                loads.append((m, c))
+        return loads
+
+    @property
+    def total_people(self) -> int:
+        return self.missionaries + self.cannibals
+
+    @property
+    def start_left(self) -> Tuple[int, int]:
+        """
+        Missionaries and cannibals on the left bank at the start.
+        """
+        return self._left_bank_for(self.start_shore)
+
+    @property
+    def goal_left(self) -> Tuple[int, int]:
+        """
+        Missionaries and cannibals on the left bank at the goal.
+        """
+        return self._left_bank_for(self.goal_shore)
+
+    @property
+    def objective_state(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """
+        Goal as ((missionaries_left, cannibals_left), (missionaries_right, cannibals_right)).
+        """
+        m_left, c_left = self.goal_left
+        return (m_left, c_left), (self.missionaries - m_left, self.cannibals - c_left)
+
+    def _left_bank_for(self, shore: Shores) -> Tuple[int, int]:
+        if shore == Shores.LEFT:
+            return self.missionaries, self.cannibals
+        return 0, 0
+
+    @property
+    def state_space_size(self) -> int:
+        """
+        Number of distinct state keys, valid or not.
+        """
+        return (self.missionaries + 1) * (self.cannibals + 1) * 2
+
+    def is_within_bounds(self, m_left: int, c_left: int) -> bool:
+        return 0 <= m_left <= self.missionaries and 0 <= c_left <= self.cannibals
+
+    def is_safe(self, m_left: int, c_left: int) -> bool:
+        """
+        No bank may have more cannibals than missionaries while it has missionaries.
+        """
+        if c_left > m_left > 0:
+            return False
+        m_right = self.missionaries - m_left
+        if self.cannibals - c_left > m_right > 0:
+            return False
+        return True
+
+    def is_goal(self, m_left: int, c_left: int) -> bool:
+        return (m_left, c_left) == self.goal_left
+
+    def encode(self, m_left: int, c_left: int, boat_position: Shores) -> int:
+        """
+        Pack a state into a single int, used as a compact key by the solvers.
+        """
+        boat = 1 if boat_position == Shores.RIGHT else 0
+        return (m_left * (self.cannibals + 1) + c_left) * 2 + boat
+
+    def decode(self, key: int) -> Tuple[int, int, Shores]:
+        """
+        Inverse of encode().
+        """
+        bank, boat = divmod(key, 2)
+        m_left, c_left = divmod(bank, self.cannibals + 1)
+        return m_left, c_left, Shores.RIGHT if boat else Shores.LEFT
+
+    def _key(self):
+        return self.missionaries, self.cannibals, self.boat_capacity, self.start_shore, self.goal_shore
+
+    def __eq__(self, other):
+        if not isinstance(other, Puzzle):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return f"Puzzle({self.missionaries}, {self.cannibals}, boat={self.boat_capacity})"
+
+
+CLASSIC_PUZZLE = Puzzle()
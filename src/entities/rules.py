@@ -0,0 +1,239 @@
+import itertools
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from src.enums import Shores
+
+BankRule = Callable[[Tuple[int, ...]], bool]
+
+
+class CrossingRules:
+    """
+    Rule definition for a river-crossing puzzle, compiled into lookup tables.
+
+    A puzzle is a set of item kinds (missionaries, wolves, husbands, ...) with a
+    count each, a boat, a bank rule saying whether a group left on one bank is
+    safe and optional limits on what the boat may carry. On construction every
+    bank configuration is checked once and every legal boat load is listed, so
+    the search only does table lookups.
+
+    Keys follow the same layout as Puzzle.encode(): the left bank counts are a
+    mixed-radix number (first kind most significant), times two, plus one when
+    the boat is on the right.
+    """
+
+    def __init__(self, kinds: Sequence[str], counts: Sequence[int], boat_capacity: int,
+                 bank_rule: Optional[BankRule] = None, load_rule: Optional[BankRule] = None,
+                 rowers: Optional[Iterable[str]] = None, weights: Optional[Dict[str, int]] = None,
+                 max_weight: Optional[int] = None, start_shore: Shores = Shores.LEFT,
+                 goal_shore: Shores = Shores.RIGHT):
+        if len(kinds) != len(counts):
+            raise ValueError("Every kind needs exactly one count.")
+        if any(count < 0 for count in counts):
+            raise ValueError("Counts cannot be negative.")
+        if boat_capacity < 1:
+            raise ValueError("The boat needs at least one seat.")
+        if max_weight is not None and weights is None:
+            raise ValueError("A weight limit needs the weight of every kind.")
+
+        self.kinds = tuple(kinds)
+        self.counts = tuple(counts)
+        self.boat_capacity = boat_capacity
+        self.start_shore = start_shore
+        self.goal_shore = goal_shore
+
+        self.radices = []
+        radix = 1
+        for count in reversed(self.counts):
+            self.radices.append(radix)
+            radix *= count + 1
+        self.radices.reverse()
+        self.bank_count = radix
+
+        self.valid_banks = self._compile_banks(bank_rule)
+        self.loads = self._compile_loads(load_rule, rowers, weights, max_weight)
+
+    def _compile_banks(self, bank_rule: Optional[BankRule]) -> bytearray:
+        """
+        One byte per left-bank configuration: 1 when both banks are safe.
+        The right bank of configuration i is configuration bank_count - 1 - i.
+        """
+        safe = bytearray(self.bank_count)
+        for index, bank in enumerate(itertools.product(*(range(count + 1) for count in self.counts))):
+            safe[index] = bank_rule is None or bool(bank_rule(bank))
+
+        last = self.bank_count - 1
+        return bytearray(safe[index] & safe[last - index] for index in range(self.bank_count))
+
+    def _compile_loads(self, load_rule: Optional[BankRule], rowers: Optional[Iterable[str]],
+                       weights: Optional[Dict[str, int]], max_weight: Optional[int]) -> List[Tuple[Tuple[Tuple[int, int], ...], int]]:
+        """
+        Every legal boat load as (needed, delta): needed lists (kind index, amount)
+        for the kinds on board and delta is how much the load shifts a bank index.
+        """
+        rower_indices = None if rowers is None else {self.kinds.index(kind) for kind in rowers}
+        kind_weights = None if weights is None else [weights[kind] for kind in self.kinds]
+
+        loads = []
+        ranges = (range(min(count, self.boat_capacity) + 1) for count in self.counts)
+        for load in itertools.product(*ranges):
+            size = sum(load)
+            if size == 0 or size > self.boat_capacity:
+                continue
+            if rower_indices is not None and not any(load[i] for i in rower_indices):
+                continue
+            if max_weight is not None and sum(w * n for w, n in zip(kind_weights, load)) > max_weight:
+                continue
+            if load_rule is not None and not load_rule(load):
+                continue
+
+            needed = tuple((i, amount) for i, amount in enumerate(load) if amount)
+            delta = sum(amount * self.radices[i] for i, amount in needed)
+            loads.append((needed, delta))
+        return loads
+
+    @property
+    def state_space_size(self) -> int:
+        return self.bank_count * 2
+
+    @property
+    def start_key(self) -> int:
+        return self._key_for(self.start_shore)
+
+    @property
+    def goal_key(self) -> int:
+        return self._key_for(self.goal_shore)
+
+    def _key_for(self, shore: Shores) -> int:
+        bank = self.bank_count - 1 if shore == Shores.LEFT else 0
+        return self.encode_bank(bank, shore)
+
+    def encode_bank(self, bank: int, boat_position: Shores) -> int:
+        return bank * 2 + (1 if boat_position == Shores.RIGHT else 0)
+
+    def encode(self, left_counts: Sequence[int], boat_position: Shores) -> int:
+        """
+        Pack the left bank counts and boat position into a key.
+        """
+        bank = sum(count * radix for count, radix in zip(left_counts, self.radices))
+        return self.encode_bank(bank, boat_position)
+
+    def decode(self, key: int) -> Tuple[Tuple[int, ...], Shores]:
+        """
+        Inverse of encode().
+        """
+        bank, boat = divmod(key, 2)
+        return self._digits(bank), Shores.RIGHT if boat else Shores.LEFT
+
+    def _digits(self, bank: int) -> Tuple[int, ...]:
+        digits = []
+        for count in reversed(self.counts):
+            bank, digit = divmod(bank, count + 1)
+            digits.append(digit)
+        digits.reverse()
+        return tuple(digits)
+
+    def is_valid_key(self, key: int) -> bool:
+        return 0 <= key < self.state_space_size and self.valid_banks[key >> 1] == 1
+
+    def next_keys(self, key: int, stats=None) -> List[int]:
+        """
+        Keys of every valid state reachable in one crossing, using only the
+        compiled tables. Same contract as Solver.get_next_keys().
+        """
+        bank, boat = key >> 1, key & 1
+        left = self._digits(bank)
+        if boat:
+            available = [count - digit for count, digit in zip(self.counts, left)]
+            sign = 1
+        else:
+            available = left
+            sign = -1
+
+        valid_banks = self.valid_banks
+        next_keys = []
+        rejected = 0
+        for needed, delta in self.loads:
+            for i, amount in needed:
+                if amount > available[i]:
+                    break
+            else:
+                new_bank = bank + sign * delta
+                if valid_banks[new_bank]:
+                    next_keys.append(new_bank * 2 + 1 - boat)
+                else:
+                    rejected += 1
+
+        if stats is not None:
+            stats.nodes_generated += len(next_keys)
+            stats.invalid_rejected += rejected
+        return next_keys
+
+    def describe(self, key: int) -> str:
+        """
+        Human readable form of a key, e.g. "wolf cabbage | farmer goat (boat right)".
+        """
+        left, boat_position = self.decode(key)
+        right = [count - digit for count, digit in zip(self.counts, left)]
+        return f"{self._describe_bank(left)} | {self._describe_bank(right)} (boat {boat_position.value})"
+
+    def _describe_bank(self, bank: Sequence[int]) -> str:
+        parts = []
+        for kind, count in zip(self.kinds, bank):
+            if count == 1:
+                parts.append(kind)
+            elif count > 1:
+                parts.append(f"{count} {kind}")
+        return " ".join(parts) or "-"
+
+    def __repr__(self):
+        kinds = ", ".join(f"{kind}={count}" for kind, count in zip(self.kinds, self.counts))
+        return f"CrossingRules({kinds}, boat={self.boat_capacity})"
+
+    @classmethod
+    def missionaries_and_cannibals(cls, missionaries: int = 3, cannibals: int = 3,
+                                   boat_capacity: int = 2) -> "CrossingRules":
+        """
+        The game's own puzzle; keys match Puzzle.encode() for the same sizes.
+        """
+        def bank_rule(bank):
+            m, c = bank
+            return not (c > m > 0)
+
+        return cls(("missionary", "cannibal"), (missionaries, cannibals), boat_capacity, bank_rule)
+
+    @classmethod
+    def jealous_husbands(cls, couples: int = 3, boat_capacity: int = 2) -> "CrossingRules":
+        """
+        No wife may be with another man unless her husband is there too,
+        on either bank or in the boat.
+        """
+        def bank_rule(bank):
+            husbands, wives = bank[:couples], bank[couples:]
+            if not any(husbands):
+                return True
+            return all(husbands[i] or not wives[i] for i in range(couples))
+
+        kinds = [f"husband{i + 1}" for i in range(couples)] + [f"wife{i + 1}" for i in range(couples)]
+        return cls(kinds, [1] * (2 * couples), boat_capacity, bank_rule, load_rule=bank_rule)
+
+    @classmethod
+    def wolf_goat_cabbage(cls) -> "CrossingRules":
+        """
+        Only the farmer rows; the goat eats the cabbage and the wolf eats the
+        goat whenever the farmer is not around.
+        """
+        def bank_rule(bank):
+            farmer, wolf, goat, cabbage = bank
+            return bool(farmer) or not (goat and (wolf or cabbage))
+
+        return cls(("farmer", "wolf", "goat", "cabbage"), (1, 1, 1, 1), 2, bank_rule, rowers=("farmer",))
+
+    @classmethod
+    def weight_limited(cls, weights: Dict[str, int], max_weight: int, boat_capacity: Optional[int] = None,
+                       rowers: Optional[Iterable[str]] = None) -> "CrossingRules":
+        """
+        One of each kind, the boat carries at most max_weight per trip, e.g. two
+        adults of 80 and two children of 40 with a boat for 80.
+        """
+        kinds = tuple(weights)
+        capacity = boat_capacity if boat_capacity is not None else len(kinds)
+        return cls(kinds, [1] * len(kinds), capacity, rowers=rowers, weights=weights, max_weight=max_weight)
@@ -1,55 +1,98 @@
 from typing import Tuple
-from src.enums import Shores, NPCType
+import weakref
+from src.enums import Shores
+from src.entities.puzzle import Puzzle, CLASSIC_PUZZLE
 
 
 class State:
-    def __init__(self, missionaries_left, cannibals_left, objective_state: Tuple[Tuple[int, int], Tuple[int, int]], boat_position: Shores, counter):
-        self.missionaries_left = missionaries_left
-        self.cannibals_left = cannibals_left
-        self.boat_position = boat_position  # "left" or "right"
-        self.objective_state = objective_state
-        self.counter = counter
+    """
+    Immutable snapshot of the game: who is on the left bank, where the boat is and
+    how many moves were made to get here. The puzzle metadata is shared, not copied.
+
+    States are interned, so building the same state twice returns the same object
+    and they can be used freely as dict keys or stored without copying.
+    """
+    __slots__ = ("missionaries_left", "cannibals_left", "boat_position", "counter", "puzzle", "__weakref__")
+
+    _cache = weakref.WeakValueDictionary()
+
+    def __new__(cls, missionaries_left: int, cannibals_left: int, boat_position: Shores, counter: int = 0,
+                puzzle: Puzzle = CLASSIC_PUZZLE):
+        identity = (missionaries_left, cannibals_left, boat_position, counter, puzzle)
+        state = cls._cache.get(identity)
+        if state is None:
+            state = super().__new__(cls)
+            object.__setattr__(state, "missionaries_left", missionaries_left)
+            object.__setattr__(state, "cannibals_left", cannibals_left)
+            object.__setattr__(state, "boat_position", boat_position)  # "left" or "right"
+            object.__setattr__(state, "counter", counter)
+            object.__setattr__(state, "puzzle", puzzle)
+            cls._cache[identity] = state
+        return state
+
+    @classmethod
+    def from_puzzle(cls, puzzle: Puzzle, counter: int = 0) -> "State":
+        """
+        Build the starting state of the given puzzle.
+        """
+        missionaries_left, cannibals_left = puzzle.start_left
+        return cls(missionaries_left, cannibals_left, puzzle.start_shore, counter, puzzle)
+
+    def with_counter(self, counter: int) -> "State":
+        """
+        Same position reached after a different number of moves.
+        """
+        return State(self.missionaries_left, self.cannibals_left, self.boat_position, counter, self.puzzle)
+
+    @property
+    def objective_state(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        return self.puzzle.objective_state
 
     @property
     def missionaries_right(self) -> int:
-        return 3 - self.missionaries_left
+        return self.puzzle.missionaries - self.missionaries_left
 
     @property
     def cannibals_right(self) -> int:
-        return 3 - self.cannibals_left
+        return self.puzzle.cannibals - self.cannibals_left
+
+    def is_objective(self):
+        # Check if all missionaries and cannibals are on the goal side
+        return self.puzzle.is_goal(self.missionaries_left, self.cannibals_left)
+
+    def is_valid(self):
+        # Validate the state: no side should have more cannibals than missionaries
+        return self.puzzle.is_safe(self.missionaries_left, self.cannibals_left)
 
-    def update_state(self, missionaries_left: int, cannibals_left: int, boat_position: Shores, counter: int):
+    @property
+    def key(self) -> int:
         """
-        Update the state with new values.
+        Compact integer identity of this state's position within its puzzle (ignores the counter).
         """
-        self.missionaries_left = missionaries_left
-        self.cannibals_left = cannibals_left
-        self.boat_position = boat_position
-        self.counter = counter
+        return self.puzzle.encode(self.missionaries_left, self.cannibals_left, self.boat_position)
 
-    def is_objective(self):
-        # Check if all missionaries and cannibals are on the right side
-        if self.missionaries_left != self.objective_state[0][0]:
-            return False
+    def _identity(self):
+        return self.missionaries_left, self.cannibals_left, self.boat_position, self.counter, self.puzzle
 
-        if self.cannibals_left != self.objective_state[0][1]:
-            return False
+    def __setattr__(self, name, value):
+        raise AttributeError("State is immutable, build a new one instead.")
 
-        if self.missionaries_right != self.objective_state[1][0]:
-            return False
+    def __delattr__(self, name):
+        raise AttributeError("State is immutable, build a new one instead.")
 
-        if self.cannibals_right != self.objective_state[1][1]:
-            return False
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, State):
+            return NotImplemented
+        return self._identity() == other._identity()
 
-        return True
+    def __hash__(self):
+        return hash(self._identity())
 
-    def is_valid(self):
-        # Validate the state: no side should have more cannibals than missionaries
-        if self.cannibals_left > self.missionaries_left and self.missionaries_left > 0:
-            return False
-        if self.cannibals_right > self.missionaries_right and self.missionaries_right > 0:
-            return False
-        return True
+    def __reduce__(self):
+        # Pickling and copying go back through __new__ so the copy is interned too
+        return State, self._identity()
 
     def __repr__(self):
         return f"State({self.missionaries_left}, {self.cannibals_left}, {self.boat_position})"
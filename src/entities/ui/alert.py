@@ -1,8 +1,9 @@
 import pygame as pg
-from pygame.sprite import Sprite
+from pygame.sprite import DirtySprite
 from pygame import gfxdraw
+from src.entities.ui.fonts import FontManager
 
-class Alert(Sprite):
+class Alert(DirtySprite):
     def __init__(self, pos, size, color, text, callback=None, text_size=28, radius=12):
         super().__init__()
         self.pos = pos
@@ -82,10 +83,10 @@ class Alert(Sprite):
         self._draw_rounded_rect(self.image, self.color, self.image.get_rect(), self.radius)
 
         # Render text
-        font = pg.font.SysFont(None, self.text_size)
-        text_surf = font.render(self.text, True, (255, 255, 255))
+        text_surf = FontManager.render(self.text, self.text_size, (255, 255, 255))
         text_rect = text_surf.get_rect(center=(self.rect.width // 2, self.rect.height // 2))
         self.image.blit(text_surf, text_rect)
+        self.dirty = 1
 
     def _draw_rounded_rect(self, surface, color, rect, radius):
         """
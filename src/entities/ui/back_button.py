@@ -1,6 +1,7 @@
 import pygame as pg
+from src.entities.ui.fonts import FontManager
 
-class BackButton(pg.sprite.Sprite):
+class BackButton(pg.sprite.DirtySprite):
     def __init__(self, pos, size, text, callback):
         super().__init__()
         self.image = pg.Surface(size)
@@ -11,9 +12,9 @@ class BackButton(pg.sprite.Sprite):
 
     def _render(self):
         self.image.fill((50, 100, 200))
-        font = pg.font.SysFont(None, 24)
-        text_surf = font.render(self.text, True, (255, 255, 255))
+        text_surf = FontManager.render(self.text, 24, (255, 255, 255))
         self.image.blit(text_surf, text_surf.get_rect(center=(self.rect.width//2, self.rect.height//2)))
+        self.dirty = 1
 
     def on_click(self):
         print("Back button clicked")
@@ -1,16 +1,31 @@
 import pygame as pg
-from pygame.sprite import Sprite
+from pygame.sprite import DirtySprite
 from pygame import gfxdraw
+from src.entities.ui.fonts import FontManager
 
 
-class CounterFrame(Sprite):
-    def __init__(self, size, top_left_pos, screen):
+class CounterFrame(DirtySprite):
+    """
+    Move counter. The frame and the text glyphs are rendered once; every
+    change composites them into the same image and marks the sprite dirty.
+    """
+    TEXT_SIZE = 36
+    TEXT_COLOR = (0, 0, 0)
+    SUFFIX = " mov"
+
+    def __init__(self, size, top_left_pos):
         super().__init__()
-        self.screen = screen
         self.size = size
         self._counter = 0
-        self.image = self._create_image()
+
+        self._background = self._create_background()
+        self._blank = pg.Surface(size, pg.SRCALPHA)
+        self._glyphs = {char: FontManager.render(char, self.TEXT_SIZE, self.TEXT_COLOR) for char in "-0123456789"}
+        self._suffix = FontManager.render(self.SUFFIX, self.TEXT_SIZE, self.TEXT_COLOR)
+
+        self.image = pg.Surface(size, pg.SRCALPHA)
         self.rect = self.image.get_rect(topleft=top_left_pos)
+        self._update_image()
 
     @property
     def counter(self):
@@ -20,8 +35,9 @@ class CounterFrame(Sprite):
         """
         Set the counter to a specific value.
         """
-        self._counter = new_val
-        self._update_image()
+        if new_val != self._counter:
+            self._counter = new_val
+            self._update_image()
 
     def increase(self):
         """
@@ -38,33 +54,36 @@ class CounterFrame(Sprite):
         """
         Reset the counter to 0.
         """
-        self._counter = 0
-        self._update_image()
+        self.set_counter(0)
 
-    def _create_image(self):
+    def _create_background(self):
         """
-        Create an image with a counter frame.
+        Create the counter frame without text.
         """
         W, H = self.size
         surf = pg.Surface((W, H), pg.SRCALPHA)
-        # Draw the frame
         gfxdraw.filled_polygon(surf, [
             (0, 0), (W, 0), (W, H), (0, H)
         ], (255, 255, 255, 200))
-        # Draw the counter text
-        font = pg.font.SysFont(None, 36)
-        text_surf = font.render(str(self._counter) + " mov", True, (0, 0, 0))
-        text_rect = text_surf.get_rect(center=(W // 2, H // 2))
-        surf.blit(text_surf, text_rect)
-
         return surf
 
     def _update_image(self):
         """
-        Update the image to reflect the current counter value.
+        Composite the frame and the glyphs of the current value into the image.
         """
-        self.image = self._create_image()
-        self.rect = self.image.get_rect(topleft=self.rect.topleft)
-        self.screen.blit(self.image, self.rect)
+        W, H = self.size
+        glyphs = [self._glyphs[char] for char in str(self._counter)]
+        glyphs.append(self._suffix)
 
+        # Centered the way get_rect(center=...) would center the whole text
+        x = W // 2 - sum(glyph.get_width() for glyph in glyphs) // 2
+        y = H // 2 - self._suffix.get_height() // 2
 
+        # Clear to transparent and add the frame: an exact copy that keeps the
+        # frame's own transparency, and far cheaper than fill() or a plain copy
+        self.image.blit(self._blank, (0, 0), special_flags=pg.BLEND_RGBA_MIN)
+        self.image.blit(self._background, (0, 0), special_flags=pg.BLEND_RGBA_ADD)
+        for glyph in glyphs:
+            self.image.blit(glyph, (x, y))
+            x += glyph.get_width()
+        self.dirty = 1
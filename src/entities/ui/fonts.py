@@ -0,0 +1,51 @@
+from collections import OrderedDict
+import pygame as pg
+
+
+class FontManager:
+    """
+    Shared fonts and rendered text for every widget.
+
+    Each (face, size) font is loaded once, and rendered text surfaces are kept
+    in an LRU cache keyed by (text, size, color, face). Cached surfaces are
+    shared between callers, so blit them but never draw on them.
+    """
+    max_texts = 256
+
+    _fonts = {}
+    _texts = OrderedDict()
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get_font(cls, size: int, face=None) -> pg.font.Font:
+        font = cls._fonts.get((face, size))
+        if font is None:
+            font = pg.font.SysFont(face, size)
+            cls._fonts[(face, size)] = font
+        return font
+
+    @classmethod
+    def render(cls, text: str, size: int, color, face=None) -> pg.Surface:
+        """
+        Anti-aliased text surface, rendered only the first time it is asked for.
+        """
+        key = (text, size, tuple(color), face)
+        surface = cls._texts.get(key)
+        if surface is not None:
+            cls.hits += 1
+            cls._texts.move_to_end(key)
+            return surface
+
+        cls.misses += 1
+        surface = cls.get_font(size, face).render(text, True, color)
+        cls._texts[key] = surface
+        if len(cls._texts) > cls.max_texts:
+            cls._texts.popitem(last=False)
+        return surface
+
+    @classmethod
+    def clear(cls):
+        cls._fonts.clear()
+        cls._texts.clear()
+        cls.hits = cls.misses = 0
@@ -0,0 +1,166 @@
+import csv
+import time
+from array import array
+import pygame as pg
+from pygame.sprite import DirtySprite
+from src.entities.ui.fonts import FontManager
+
+
+class FrameProfiler(DirtySprite):
+    """
+    Frame profiler overlay: a rolling graph of frame times split by phase,
+    plus the average and worst time of each phase over the recorded frames
+    and the CPU time the process used per second since the last refresh.
+
+    Timings are recorded every frame into fixed ring buffers, even while the
+    overlay is hidden, so the graph and the CSV export have history as soon
+    as they are asked for. The image and graph surfaces are allocated once;
+    the graph scrolls by one pixel per frame and only its newest column is drawn.
+    """
+    # Phases stacked in the graph, bottom to top; "map" is the part of "update" spent in Map.update
+    PHASES = ("events", "update", "draw")
+    SUB_PHASES = ("map",)
+    COLORS = {
+        "events": (80, 160, 255),
+        "update": (255, 190, 60),
+        "draw": (120, 220, 120),
+    }
+    TEXT_SIZE = 18
+    LINE_HEIGHT = 16
+    TEXT_REFRESH = 15  # Frames between two refreshes of the numbers
+
+    def __init__(self, pos, size, fps: int, history: int = 240, graph_ms: float = 50.0):
+        super().__init__()
+        self.image = pg.Surface(size, pg.SRCALPHA)
+        self.rect = self.image.get_rect(topleft=pos)
+        self.visible = False
+
+        self.budget = 1.0 / fps
+        self.history = history
+        self.graph_ms = graph_ms
+
+        # Ring buffers in seconds; "interval" is the time between two frame starts
+        names = self.PHASES + self.SUB_PHASES + ("interval",)
+        self._samples = {name: array("d", bytes(8 * history)) for name in names}
+        self._index = -1
+        self._count = 0
+        self._frame_start = None
+        self._mark = None
+        self._cpu_mark = (time.process_time(), time.perf_counter())
+
+        width, height = size
+        self._text_height = self.LINE_HEIGHT * (len(self.PHASES) + len(self.SUB_PHASES) + 1) + 8
+        self._graph = pg.Surface((width, height - self._text_height))
+        self._graph.fill((0, 0, 0))
+        self._budget_y = self._graph_y(self.budget)
+
+    def toggle(self):
+        self.visible = not self.visible
+        if self.visible:
+            self._render_text()
+
+    def draw(self, surface):
+        if self.visible:
+            surface.blit(self.image, self.rect)
+
+    def start_frame(self):
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self._samples["interval"][self._index] = now - self._frame_start
+        self._index = (self._index + 1) % self.history
+        for samples in self._samples.values():
+            samples[self._index] = 0.0
+        self._count += 1
+        self._frame_start = self._mark = now
+
+    def lap(self, phase: str):
+        """
+        Charge the time since the last lap (or the frame start) to phase.
+        """
+        now = time.perf_counter()
+        self._samples[phase][self._index] += now - self._mark
+        self._mark = now
+
+    def add(self, phase: str, seconds: float):
+        self._samples[phase][self._index] += seconds
+
+    def end_frame(self):
+        if not self.visible:
+            return
+        self._scroll_graph()
+        if self._count % self.TEXT_REFRESH == 0:
+            self._render_text()
+        else:
+            self.image.blit(self._graph, (0, self._text_height))
+        self.dirty = 1
+
+    def frames(self):
+        """
+        Recorded frames, oldest first, as dicts of phase -> seconds. The
+        newest frame is left out: it is still running, and its interval is
+        only known once the next one starts.
+        """
+        count = min(self._count, self.history) - 1
+        for offset in range(count, 0, -1):
+            index = (self._index - offset) % self.history
+            yield {name: samples[index] for name, samples in self._samples.items()}
+
+    def export_csv(self, path: str, last: int = None) -> int:
+        """
+        Write the last `last` frames (all recorded ones by default) in
+        milliseconds and return how many rows were written.
+        """
+        rows = list(self.frames())
+        if last is not None:
+            rows = rows[-last:]
+        names = list(self._samples)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + [f"{name}_ms" for name in names])
+            first = self._count - 1 - len(rows)
+            for number, row in enumerate(rows, first):
+                writer.writerow([number] + [f"{row[name] * 1000:.4f}" for name in names])
+        return len(rows)
+
+    def _graph_y(self, seconds: float) -> int:
+        height = self._graph.get_height()
+        return height - 1 - min(height - 1, int(seconds * 1000 / self.graph_ms * (height - 1)))
+
+    def _scroll_graph(self):
+        graph = self._graph
+        x = graph.get_width() - 1
+        graph.scroll(-1, 0)
+        pg.draw.line(graph, (0, 0, 0), (x, 0), (x, graph.get_height() - 1))
+
+        index = self._index
+        bottom, total = graph.get_height() - 1, 0.0
+        for phase in self.PHASES:
+            total += self._samples[phase][index]
+            top = self._graph_y(total)
+            if top < bottom:
+                pg.draw.line(graph, self.COLORS[phase], (x, bottom), (x, top))
+            bottom = top
+        graph.set_at((x, self._budget_y), (255, 60, 60))
+
+    def _render_text(self):
+        self.image.fill((0, 0, 0, 190))
+        frames = list(self.frames())
+        lines = []
+        if frames:
+            interval = sum(frame["interval"] for frame in frames) / len(frames)
+            fps = 1 / interval if interval else 0.0
+            cpu, wall = time.process_time(), time.perf_counter()
+            cpu_per_second = (cpu - self._cpu_mark[0]) / (wall - self._cpu_mark[1])
+            self._cpu_mark = (cpu, wall)
+            lines.append((f"{fps:5.1f} fps, CPU {cpu_per_second * 1000:.0f} ms/s, budget {self.budget * 1000:.1f} ms",
+                          (255, 255, 255)))
+            for phase in self.PHASES + self.SUB_PHASES:
+                values = [frame[phase] for frame in frames]
+                lines.append((f"{phase:>7}: avg {sum(values) / len(values) * 1000:6.2f} ms  "
+                              f"max {max(values) * 1000:6.2f} ms", self.COLORS.get(phase, (255, 255, 255))))
+
+        # Numbers change constantly, so they bypass the shared text cache
+        font = FontManager.get_font(self.TEXT_SIZE)
+        for idx, (line, color) in enumerate(lines):
+            self.image.blit(font.render(line, True, color), (6, 4 + idx * self.LINE_HEIGHT))
+        self.image.blit(self._graph, (0, self._text_height))
@@ -1,21 +1,40 @@
 import pygame as pg
+from src.enums import MoveSafety
+from src.entities.ui.fonts import FontManager
 
 
-class MoveButton(pg.sprite.Sprite):
+class MoveButton(pg.sprite.DirtySprite):
+    COLORS = {
+        MoveSafety.EMPTY: (50, 200, 50),
+        MoveSafety.SAFE: (50, 200, 50),
+        MoveSafety.DEAD_END: (220, 120, 0),
+        MoveSafety.FATAL: (200, 40, 40),
+        MoveSafety.INVALID: (120, 120, 120),
+    }
+
     def __init__(self, pos, size, text, callback):
         super().__init__()
         self.image = pg.Surface(size)
         self.rect = self.image.get_rect(topleft=pos)
         self.text = text
         self.callback = callback
+        self.safety = MoveSafety.EMPTY
 
         self._render()
 
+    def set_safety(self, safety: MoveSafety):
+        """
+        Tint the button by what the loaded move would do, re-rendering only on change.
+        """
+        if safety != self.safety:
+            self.safety = safety
+            self._render()
+
     def _render(self):
-        self.image.fill((50, 200, 50))
-        font = pg.font.SysFont(None, 28)
-        text_surf = font.render(self.text, True, (255, 255, 255))
+        self.image.fill(self.COLORS[self.safety])
+        text_surf = FontManager.render(self.text, 28, (255, 255, 255))
         self.image.blit(text_surf, text_surf.get_rect(center=(self.rect.width//2, self.rect.height//2)))
+        self.dirty = 1
 
     def on_click(self):
         self.callback()
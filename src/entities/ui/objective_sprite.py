@@ -3,7 +3,7 @@ from pygame import gfxdraw
 from src.entities.state import State
 from src.enums import Shores
 
-class ObjectiveSprite(pg.sprite.Sprite):
+class ObjectiveSprite(pg.sprite.DirtySprite):
     def __init__(self, objective_state: State, pos, size, callback, parent):
         super().__init__()
         self.parent = parent
@@ -95,5 +95,6 @@ class ObjectiveSprite(pg.sprite.Sprite):
         draw_side(Shores.RIGHT, right_m, right_c)
 
         self.image.blit(shape_surface, (0, 0))
+        self.dirty = 1
 
 
@@ -1,9 +1,10 @@
 import pygame as pg
-from pygame.sprite import Sprite
+from pygame.sprite import DirtySprite
 from pygame import gfxdraw
+from src.entities.ui.fonts import FontManager
 
 
-class SolveButton(Sprite):
+class SolveButton(DirtySprite):
     def __init__(self, pos, size, text, callback):
         super().__init__()
         self.image = pg.Surface(size, pg.SRCALPHA)
@@ -12,13 +13,21 @@ class SolveButton(Sprite):
         self.callback = callback
         self._render()
 
+    def set_text(self, text):
+        """
+        Change the label, re-rendering only when it actually changes.
+        """
+        if text != self.text:
+            self.text = text
+            self._render()
+
     def _render(self):
         W, H = self.rect.size
         self.image.fill((50, 20, 200))
-        font = pg.font.SysFont(None, 24)
-        text_surf = font.render(self.text, True, (255, 255, 255))
+        text_surf = FontManager.render(self.text, 24, (255, 255, 255))
         text_rect = text_surf.get_rect(center=(W // 2, H // 2))
         self.image.blit(text_surf, text_rect)
+        self.dirty = 1
 
     def on_click(self):
         print("Solve button clicked")
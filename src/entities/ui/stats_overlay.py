@@ -0,0 +1,51 @@
+import pygame as pg
+from pygame.sprite import DirtySprite
+from src.entities.ui.fonts import FontManager
+
+
+class StatsOverlay(DirtySprite):
+    """
+    Debug panel showing the search statistics of the last solve.
+    Hidden by default; toggled from the game with a hotkey.
+    """
+
+    def __init__(self, pos, size, text_size=20, line_height=18):
+        super().__init__()
+        self.image = pg.Surface(size, pg.SRCALPHA)
+        self.rect = self.image.get_rect(topleft=pos)
+        self.text_size = text_size
+        self.line_height = line_height
+        self.visible = False
+        self._lines = None
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def set_stats(self, title, stats):
+        """
+        Show the given SearchStats, re-rendering only when a number changed.
+        """
+        slowest = max(stats.layer_times, default=0.0)
+        lines = [
+            title,
+            f"Generated: {stats.nodes_generated}",
+            f"Expanded: {stats.nodes_expanded}",
+            f"Duplicates: {stats.duplicates_pruned}",
+            f"Invalid: {stats.invalid_rejected}",
+            f"Peak frontier: {stats.peak_frontier}",
+            f"Layers: {len(stats.layer_times)} (slowest {slowest * 1000:.2f} ms)",
+        ]
+        if lines != self._lines:
+            self._lines = lines
+            self._render()
+
+    def draw(self, surface):
+        if self.visible and self._lines:
+            surface.blit(self.image, self.rect)
+
+    def _render(self):
+        self.image.fill((0, 0, 0, 170))
+        for idx, line in enumerate(self._lines):
+            text_surf = FontManager.render(line, self.text_size, (255, 255, 255))
+            self.image.blit(text_surf, (8, 6 + idx * self.line_height))
+        self.dirty = 1
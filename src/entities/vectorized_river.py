@@ -0,0 +1,144 @@
+"""
+NumPy backend for drawing the Map's river.
+
+Computes every river and shore edge of a frame at once, labels each pixel as
+land, shore or water by comparing its column with the edges of its row and
+writes the colors straight into the surface with pygame.surfarray. Edge pixels
+are blended by how much of them lies on each side, standing in for the
+anti-aliased outlines gfxdraw draws.
+
+After the first frame on a surface only the two strips around the banks
+(Map.animated_strips()) are rewritten, since nothing else ever changes.
+"""
+try:
+    import numpy as np
+    from pygame import surfarray
+except ImportError:  # numpy is only needed for this backend
+    np = None
+
+from pygame.surface import Surface
+
+
+class VectorizedRiver:
+    """
+    Rasterizes one Map's river into reused pixel buffers.
+    """
+
+    @staticmethod
+    def is_available() -> bool:
+        return np is not None
+
+    def __init__(self, landscape):
+        if np is None:
+            raise RuntimeError("The vectorized river needs numpy installed.")
+
+        self.landscape = landscape
+        width, height = landscape.size
+
+        # Edges are polygons with a vertex every 5 rows, like the gfxdraw version
+        self.vertex_rows = np.arange(0, height, 5, dtype=np.float64)
+        self.rows = np.arange(height, dtype=np.float64)
+        self.below_last_vertex = self.rows > self.vertex_rows[-1]
+
+        # Pixel labels from left to right: land, shore, water, shore, land
+        self.palette = np.array([landscape.land_color, landscape.shore_color, landscape.water_color,
+                                 landscape.shore_color, landscape.land_color], dtype=np.float64)
+        self.mapped_palette = None  # Palette in the target surface's pixel format
+
+        # Each strip only ever holds one bank: the left one sees the first two
+        # edges, the right one the last two
+        left_strip, right_strip = landscape.animated_strips()
+        self.strips = [self._buffers(left_strip.left, left_strip.right, height, 0),
+                       self._buffers(right_strip.left, right_strip.right, height, 2)]
+        self._surface = None  # Surface whose static parts are already drawn
+
+    @staticmethod
+    def _buffers(start: int, stop: int, height: int, first_edge: int, edge_count: int = 2):
+        # Column-major like a surfarray view of the surface, so writes stay sequential
+        width = stop - start
+        return {
+            "start": start,
+            "stop": stop,
+            "first_edge": first_edge,
+            "edge_count": edge_count,
+            "columns": np.arange(start, stop, dtype=np.float64)[:, np.newaxis],
+            "mask": np.empty((width, height), dtype=bool, order="F"),
+        }
+
+    def _edges(self):
+        """
+        Column of the four boundaries (left shore, left bank, right bank, right
+        shore) on every row; rows below the last vertex have no river.
+        """
+        landscape = self.landscape
+        counter = landscape.counter
+        ys = self.vertex_rows
+
+        wave = np.sin((ys + counter) / landscape.wavy_frequency) + np.sin((2 * ys + counter) / landscape.wavy_frequency) / 5
+        center = np.trunc(wave * landscape.wavy_amplitude + landscape.size[0] // 2)
+        left = center + (-landscape.river_width // 2)
+        right = center + landscape.river_width // 2
+
+        shore_left = left - (landscape.shore_width + self._shore_wave(landscape.shore_phase_offset_left))
+        shore_right = right + (landscape.shore_width + self._shore_wave(landscape.shore_phase_offset_right))
+
+        edges = []
+        for vertices in (shore_left, left, right, shore_right):
+            edge = np.interp(self.rows, ys, vertices)
+            edge[self.below_last_vertex] = np.inf
+            edges.append(edge)
+        return edges
+
+    def _shore_wave(self, phase_offset):
+        landscape = self.landscape
+        return np.sin((self.vertex_rows + landscape.counter + phase_offset) / landscape.shore_frequency) * landscape.shore_amplitude
+
+    def _map_colors(self, surface: Surface, colors):
+        """
+        Convert an (n, 3) array of RGB colors to the surface's pixel format.
+        """
+        rgb = np.rint(colors).astype(np.uint8)[:, np.newaxis, :]
+        return surfarray.map_array(surface, rgb)[:, 0].astype(f"u{surface.get_bytesize()}")
+
+    def _rasterize(self, surface: Surface, buffers, edges, pixels):
+        """
+        Write mapped pixel values of columns start..stop into pixels,
+        an array of shape (stop - start, height).
+        """
+        columns, mask = buffers["columns"], buffers["mask"]
+        first, count = buffers["first_edge"], buffers["edge_count"]
+
+        pixels[...] = self.mapped_palette[first]
+        for index in range(first, first + count):
+            np.greater_equal(columns, edges[index], out=mask)
+            np.copyto(pixels, self.mapped_palette[index + 1], where=mask)
+        pixels[:, self.below_last_vertex] = self.mapped_palette[0]
+
+        start, stop = buffers["start"], buffers["stop"]
+        for index in range(first, first + count):
+            edge = edges[index]
+            rows = np.nonzero((edge >= start) & (edge < stop))[0]
+            edge_columns = np.floor(edge[rows])
+            right_share = (edge_columns + 1 - edge[rows])[:, np.newaxis]
+            blended = right_share * self.palette[index + 1] + (1 - right_share) * self.palette[index]
+            pixels[edge_columns.astype(np.intp) - start, rows] = self._map_colors(surface, blended)
+
+    def render(self, surface: Surface):
+        """
+        Draw the landscape at the map's current counter onto the surface.
+        """
+        edges = self._edges()
+
+        if surface is not self._surface:
+            self.mapped_palette = self._map_colors(surface, self.palette)
+            whole = self._buffers(0, surface.get_width(), surface.get_height(), 0, 4)
+            pixels = np.empty(whole["mask"].shape, dtype=self.mapped_palette.dtype, order="F")
+            self._rasterize(surface, whole, edges, pixels)
+            surfarray.blit_array(surface, pixels)
+            self._surface = surface
+            return
+
+        view = surfarray.pixels2d(surface)
+        for strip in self.strips:
+            self._rasterize(surface, strip, edges, view[strip["start"]:strip["stop"]])
+        del view  # Unlocks the surface
@@ -6,6 +6,24 @@ class Shores(Enum):
     RIGHT = "right"
 
 
+class SolverStrategy(Enum):
+    BFS = "bfs"
+    BIDIRECTIONAL = "bidirectional"
+    TABLE = "table"
+    ASTAR = "astar"
+    IDASTAR = "idastar"
+    VECTORIZED = "vectorized"
+    CONSTRUCTIVE = "constructive"
+
+
+class MoveSafety(Enum):
+    EMPTY = "empty"          # Nobody on the boat
+    SAFE = "safe"            # The goal is still reachable afterwards
+    DEAD_END = "dead_end"    # Nobody dies, but the goal can no longer be reached
+    FATAL = "fatal"          # Missionaries get eaten
+    INVALID = "invalid"      # The load is not on the boat's bank, the boat cannot carry it
+
+
 class NPCType(Enum):
     MISSIONARY = 0
     CANNIBAL = 1
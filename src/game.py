@@ -1,6 +1,7 @@
 import pygame as pg
 from src import settings
 from src.entities.map import Map
+from src.entities.vectorized_river import VectorizedRiver
 from src.entities.boat import Boat
 from src.entities.npc import NPC, NPCType
 from src.entities.ui.reset_button import ResetButton
@@ -10,17 +11,29 @@ from src.entities.ui.solve_button import SolveButton
 from src.entities.ui.objective_sprite import ObjectiveSprite
 from src.entities.ui.counter_frame import CounterFrame
 from src.entities.ui.alert import Alert
+from src.entities.ui.stats_overlay import StatsOverlay
+from src.entities.ui.frame_profiler import FrameProfiler
 from src.entities.state import State
+from src.entities.puzzle import Puzzle
 from src.sounds.manager import SoundManager
-from src.enums import Shores, NPCType
-from src.solver import Solver
+from src.enums import Shores, NPCType, SolverStrategy, MoveSafety
+from src.reachability import Reachability
+from src.solve_worker import SolveWorker
+from src.tweens import TweenScheduler
 from src.utils import resource_path
-import copy
 import os
+import time
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless: bool = False):
+        """
+        headless runs on SDL's dummy video and audio drivers, so no window or
+        sound device is needed (benchmarks, machines without a display).
+        """
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pg.init()
         self.screen = pg.display.set_mode(settings.DIMENSIONS)
         pg.display.set_caption("Missionaries and Cannibals")
@@ -30,20 +43,37 @@ class Game:
         self.clock = pg.time.Clock()
         self.running = True
         self.auto_solving = False
+        self.solve_worker = None
+        self.last_solve_stats = None  # SearchStats of the most recent solve, shown by the overlay
+        self.autosolve_delay = settings.AUTOSOLVE_DELAY  # milliseconds between autosolve moves, 0 is max speed
+        self.last_autosolve_move = 0
+        self.autosolve_moves = 0
         self.fps = settings.FPS
-        self.counter = CounterFrame((100, 50), (0, settings.DIMENSIONS[1] - 50), self.screen)
-        self.objective_state = ((0, 0), (3, 3))
+        self.adaptive_frame_rate = settings.ADAPTIVE_FRAME_RATE
+        self.last_input_time = 0
+        self.frame_start = 0
+
+        # Fixed-step simulation clock; the game logic runs on it, not on frames
+        self.step_ms = 1000 / settings.SIMULATION_HZ
+        self.sim_time = 0.0
+        self.sim_lag = 0.0  # Elapsed time not simulated yet, less than one step
+        self.tweens = TweenScheduler(settings.MOVE_DURATION_MS)
+        self.counter = CounterFrame((100, 50), (0, settings.DIMENSIONS[1] - 50))
+        self.puzzle = Puzzle()
+        self.objective_state = self.puzzle.objective_state
+        self.reachability = Reachability(self.puzzle)
 
         # Sounds manager setup
         sounds_dir = resource_path(os.path.join('assets', 'sounds'))
         self.sound_manager = SoundManager(sounds_dir)
         self.sound_manager.start_background_loop()
 
-        self.current_state = State(3, 3, self.objective_state, Shores.LEFT, self.counter.counter)
+        self.current_state = State.from_puzzle(self.puzzle, self.counter.counter)
         self.state_history = [self.current_state]
 
-        # Groups
-        self.all_sprites = pg.sprite.LayeredUpdates()
+        # Groups; in dirty mode only the changed screen areas are redrawn and pushed to the display
+        self.dirty_rendering = settings.DIRTY_RENDERING
+        self.all_sprites = pg.sprite.LayeredDirty() if self.dirty_rendering else pg.sprite.LayeredUpdates()
         self.npc_sprites = pg.sprite.Group()
 
         self.map = self.create_map()
@@ -63,6 +93,12 @@ class Game:
         self.bad_alert = Alert((settings.DIMENSIONS[0] // 2 - settings.DIMENSIONS[0] // 10, settings.DIMENSIONS[1] // 2 - 50),
                                 (settings.DIMENSIONS[0] // 5, settings.DIMENSIONS[1] // 5), (255, 0, 0), "Missionaries killed!", None)
 
+        # Solver debug overlay, toggled with F2
+        self.stats_overlay = StatsOverlay((10, 110), (260, 136))
+
+        # Frame profiler overlay, toggled with F3; F4 dumps the recorded frames to CSV
+        self.profiler = FrameProfiler((settings.DIMENSIONS[0] - 330, 120), (320, 200), self.fps)
+
         self.reset_game(init=True)
 
     def good_alert_callback(self):
@@ -91,35 +127,89 @@ class Game:
         self.roll_to_state(self.current_state)
 
     def solve_from_current_state(self):
+        """
+        Start solving on a background thread. Playback happens in update() as
+        soon as the first states of the solution arrive.
+        """
+        self.boat.unload()  # The solution starts from the state without them
         self.auto_solving = True
         self.sound_manager.stop_background_loop()
         self.sound_manager.play('autosolve')
-        states: list[State] = Solver.solve_from_state(self.current_state)
 
-        delay_between_moves = 500  # milliseconds
-        last_move_time = pg.time.get_ticks()
+        self.solve_worker = SolveWorker(self.current_state, SolverStrategy.TABLE)
+        self.solve_worker.start()
+        self.last_solve_stats = self.solve_worker.stats
+        self.last_autosolve_move = self.sim_time
+        self.autosolve_moves = 0
+        self._apply_move_duration()
+
+    def change_autosolve_speed(self, faster: bool):
+        """
+        Step through settings.AUTOSOLVE_DELAYS; the fastest one plays a move
+        every simulation step and skips the gliding.
+        """
+        delays = settings.AUTOSOLVE_DELAYS
+        index = min(range(len(delays)), key=lambda i: abs(delays[i] - self.autosolve_delay))
+        index = min(len(delays) - 1, index + 1) if faster else max(0, index - 1)
+        self.autosolve_delay = delays[index]
+        label = "Max speed" if self.autosolve_delay == 0 else f"{1000 / self.autosolve_delay:g} moves/s"
+        print(f"Autosolve speed: {label}")
+        if self.auto_solving:
+            self.solve_button.set_text(label)
+        self._apply_move_duration()
+
+    def _apply_move_duration(self):
+        """
+        Moves glide for MOVE_DURATION_MS, but never for longer than the autosolve
+        delay so playback does not fall behind; at max speed they are instant.
+        """
+        duration = settings.MOVE_DURATION_MS
+        if self.auto_solving:
+            duration = min(duration, self.autosolve_delay)
+        self.tweens.duration = duration
+
+    def _update_autosolve(self):
+        if not self.auto_solving:
+            return
 
-        current_index = 0
-        solving = True
+        worker = self.solve_worker
+        if self.autosolve_moves == 0 and not worker.finished:
+            self.solve_button.set_text(f"Solving {worker.stats.nodes_expanded}")
 
-        while solving:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(self.fps)
-
-            now = pg.time.get_ticks()
-            if now - last_move_time >= delay_between_moves:
-                if current_index < len(states):
-                    self.roll_to_state(states[current_index])
-                    current_index += 1
-                    last_move_time = now
-                else:
-                    solving = False
-                    self.validate_state(self.current_state)
-                    self.auto_solving = False
+        now = self.sim_time
+        if now - self.last_autosolve_move < self.autosolve_delay:
+            return
+
+        state = worker.next_state()
+        if state is not None:
+            self.roll_to_state(state)
+            self.autosolve_moves += 1
+            self.last_autosolve_move = now
+        elif worker.finished:
+            self._stop_autosolve()
+            if self.autosolve_moves == 0:
+                self.warning_alert.set_text("No solution!")
+                self.sound_manager.play('warning')
+                self.warning_alert.show(5000, on_hide_callback=lambda: self.sound_manager.stop('warning'))
+            self.validate_state(self.current_state)
+
+    def _stop_autosolve(self):
+        """
+        Cancel a running solve, if any, and give control back to the player.
+        """
+        if self.solve_worker is not None:
+            self.solve_worker.cancel()
+            self.solve_worker = None
+        if self.auto_solving:
+            self.sound_manager.stop('autosolve')
+        self.auto_solving = False
+        self.solve_button.set_text("Solve")
+        self._apply_move_duration()
 
     def roll_to_state(self, state: State):
+        # Boarded passengers are not part of any state
+        self.boat.unload()
+
         # Roll back counter
         self.counter.set_counter(state.counter)
 
@@ -149,6 +239,7 @@ class Game:
 
     def reset_game(self, init=False):
         width, height = settings.DIMENSIONS
+        self._stop_autosolve()
         self.all_sprites.empty()
         self.npc_sprites.empty()
 
@@ -156,14 +247,14 @@ class Game:
             self.sound_manager.start_background_loop()
 
         self.boat.reset_boat()
+        self.tweens.finish()  # Resets are instant
 
         self.counter.reset()
 
-        self.current_state = State(3, 3, self.objective_state, Shores.LEFT, self.counter.counter)
+        self.current_state = State.from_puzzle(self.puzzle, self.counter.counter)
         self.state_history = [self.current_state]
 
-        # Add map and boat
-        self.all_sprites.add(self.map, layer=0)
+        # Add the boat; the map is drawn as the background
         self.all_sprites.add(self.boat, layer=1)
 
         # Add NPCs to the left bank
@@ -176,8 +267,10 @@ class Game:
             mis_h = height // 5 * (1 + i)
             can_h = height // 5 * (1 + i) + height // 10
 
-            missionary = NPC((mis_w_r, mis_h), (mis_w_l, mis_h), npc_size, NPCType.MISSIONARY, Shores.LEFT, self.screen)
-            cannibal = NPC((can_w_r, can_h), (can_w_l, can_h), npc_size, NPCType.CANNIBAL, Shores.LEFT, self.screen)
+            missionary = NPC((mis_w_r, mis_h), (mis_w_l, mis_h), npc_size, NPCType.MISSIONARY, Shores.LEFT, self.screen,
+                             self.tweens)
+            cannibal = NPC((can_w_r, can_h), (can_w_l, can_h), npc_size, NPCType.CANNIBAL, Shores.LEFT, self.screen,
+                           self.tweens)
             self.all_sprites.add(missionary, layer=2)
             self.all_sprites.add(cannibal, layer=2)
             self.npc_sprites.add(missionary, cannibal)
@@ -192,6 +285,12 @@ class Game:
 
         self.all_sprites.add(self.objective_sprite, layer=5)
 
+        if self.dirty_rendering:
+            # Alerts and the overlay are hidden through DirtySprite.visible
+            self.all_sprites.add(self.good_alert, self.warning_alert, self.bad_alert, layer=6)
+            self.all_sprites.add(self.stats_overlay, layer=7)
+            self.all_sprites.add(self.profiler, layer=8)
+
         if not init:
             print("Game reset!")
 
@@ -201,7 +300,16 @@ class Game:
         else:
             objective_sprite.expand_on_parent()
 
+    def loaded_move_safety(self) -> MoveSafety:
+        """
+        Judge the move the boat would make with its current passengers, without moving it.
+        """
+        missionaries = sum(1 for npc in self.boat.passengers if npc.npc_type == NPCType.MISSIONARY)
+        cannibals = len(self.boat.passengers) - missionaries
+        return self.reachability.classify_move(self.current_state.key, missionaries, cannibals)
+
     def move_boat(self):
+        safety = self.loaded_move_safety()
 
         if not self.boat.move():
             self.sound_manager.play('warning')
@@ -216,6 +324,10 @@ class Game:
         self.draw()
 
         self.validate_state(self.current_state)
+        if safety == MoveSafety.DEAD_END:
+            self.sound_manager.play('warning')
+            self.warning_alert.set_text("Dead end, go back!")
+            self.warning_alert.show(5000, on_hide_callback=lambda: self.sound_manager.stop('warning'))
 
     def update_state(self):
         missionaries_left = 0
@@ -227,8 +339,7 @@ class Game:
                 elif npc.npc_type == NPCType.CANNIBAL:
                     cannibals_left += 1
 
-        return State(missionaries_left, cannibals_left, self.objective_state, self.boat.current_shore,
-                     self.counter.counter)
+        return State(missionaries_left, cannibals_left, self.boat.current_shore, self.counter.counter, self.puzzle)
 
     def validate_state(self, state: State):
         print(f"Validating state: {state}")
@@ -243,7 +354,7 @@ class Game:
             self.good_alert.show(5000, on_hide_callback=lambda: self.sound_manager.stop('success'))
             self.reset_game()
         else:
-            self.state_history.append(copy.deepcopy(state))
+            self.state_history.append(state)
 
     def create_map(self):
         return Map(
@@ -254,7 +365,10 @@ class Game:
             river_width=settings.DIMENSIONS[0] // 3,
             wavy_frequency=100,
             wavy_amplitude=10,
-            shore_width=30
+            shore_width=30,
+            animation_frames=settings.RIVER_FRAMES,  # Rendered lazily during the first loop
+            cache_size=settings.RIVER_CACHE_FRAMES,
+            vectorized=VectorizedRiver.is_available()
         )
 
     def create_boat(self):
@@ -263,24 +377,81 @@ class Game:
             left_pos=(W // 3 - W // 20, H // 2 - H // 20),
             right_pos=(W * 2 // 3 - W // 20, H // 2 - H // 20),
             start_pos=Shores.LEFT,
-            dimensions=(W // 7, H // 7)
+            dimensions=(W // 7, H // 7),
+            capacity=self.puzzle.boat_capacity,
+            tweens=self.tweens
         )
 
     def run(self):
+        profiler = self.profiler
+        elapsed = 0
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
         while self.running:
+            self.frame_start = pg.time.get_ticks()
+            profiler.start_frame()
             self.handle_events()
-            self.update()
+            profiler.lap("events")
+            self.update(elapsed)
+            profiler.lap("update")
             self.draw()
-            self.clock.tick(self.fps)
+            profiler.lap("draw")
+            profiler.end_frame()
+            elapsed = self._wait_for_next_frame()
+        wall = time.perf_counter() - wall_start
+        if wall > 0:
+            print(f"Average CPU time: {(time.process_time() - cpu_start) / wall * 1000:.1f} ms per second "
+                  f"over {wall:.1f} s")
+        if self.solve_worker is not None:
+            self.solve_worker.cancel(timeout=1.0)
         pg.quit()
 
+    def is_active(self) -> bool:
+        """
+        Whether anything besides the river is moving or the player just did something.
+        """
+        return (self.auto_solving or len(self.tweens) > 0
+                or pg.time.get_ticks() - self.last_input_time < settings.IDLE_AFTER_MS)
+
+    def _wait_for_next_frame(self) -> int:
+        """
+        Cap the frame rate at FPS while the game is active. When idle, sleep
+        in pg.event.wait until the next IDLE_FPS frame is due, waking up at
+        once on input. Returns the milliseconds since the previous frame.
+        """
+        if not self.adaptive_frame_rate or self.is_active():
+            return self.clock.tick(self.fps)
+
+        timeout = 1000 // settings.IDLE_FPS - (pg.time.get_ticks() - self.frame_start)
+        if timeout > 0:
+            event = pg.event.wait(timeout)
+            if event.type != pg.NOEVENT:
+                # Put it back, in order, for handle_events
+                for queued in [event] + pg.event.get():
+                    pg.event.post(queued)
+        return self.clock.tick()
+
     def handle_events(self):
         for event in pg.event.get():
+            self.last_input_time = pg.time.get_ticks()
             self.sound_manager.handle_event(event)
             if event.type == pg.QUIT:
                 self.running = False
+            elif event.type == pg.KEYDOWN and event.key == pg.K_F2:
+                self.stats_overlay.toggle()
+            elif event.type == pg.KEYDOWN and event.key == pg.K_F3:
+                self.profiler.toggle()
+            elif event.type == pg.KEYDOWN and event.key == pg.K_F4:
+                path = f"frame_profile_{time.strftime('%Y%m%d_%H%M%S')}.csv"
+                print(f"Wrote {self.profiler.export_csv(path)} frames to {path}")
+            elif event.type == pg.KEYDOWN and event.key in (pg.K_PLUS, pg.K_EQUALS, pg.K_KP_PLUS):
+                self.change_autosolve_speed(faster=True)
+            elif event.type == pg.KEYDOWN and event.key in (pg.K_MINUS, pg.K_KP_MINUS):
+                self.change_autosolve_speed(faster=False)
             elif event.type == pg.MOUSEBUTTONDOWN:
                 if self.auto_solving:
+                    # Only Reset works while solving, it cancels the solve
+                    if event.button == 1 and self.reset_button.rect.collidepoint(event.pos):
+                        self.reset_button.on_click()
                     continue
                 if event.button == 1:
                     if self.reset_button.rect.collidepoint(event.pos):
@@ -330,17 +501,62 @@ class Game:
         for idx, passenger in enumerate(self.boat.passengers):
             offset_x = -15 + idx * 30  # spread passengers on boat
             passenger.rect.midbottom = (self.boat.rect.centerx + offset_x, self.boat.rect.top)
-
-    def update(self):
+            passenger.dirty = 1
+
+    def update(self, elapsed_ms: float = None):
+        """
+        Run the simulation steps that fit in elapsed_ms (one step when not
+        given), then place the tweened sprites at the render time and
+        refresh the UI.
+        """
+        steps = self._simulate(self.step_ms if elapsed_ms is None else elapsed_ms)
+        self.tweens.apply(self.sim_lag)
+        self.move_button.set_safety(self.loaded_move_safety())
+        if self.stats_overlay.visible and self.last_solve_stats is not None:
+            self.stats_overlay.set_stats("Solver statistics", self.last_solve_stats)
+        map_start = time.perf_counter()
+        self.map.update(steps)
+        self.profiler.add("map", time.perf_counter() - map_start)
         self.all_sprites.update()
+        if self.dirty_rendering:
+            return  # Alerts are in the group too
         self.good_alert.update()
         self.warning_alert.update()
         self.bad_alert.update()
 
+    def _simulate(self, elapsed_ms: float) -> int:
+        """
+        Advance the game by whole fixed steps. Slow frames run several steps
+        to keep game time on the clock, up to MAX_SIMULATION_STEPS.
+        """
+        self.sim_lag += min(elapsed_ms, self.step_ms * settings.MAX_SIMULATION_STEPS)
+        steps = 0
+        while self.sim_lag >= self.step_ms:
+            self.sim_lag -= self.step_ms
+            self.sim_time += self.step_ms
+            self._update_autosolve()
+            self.tweens.update(self.step_ms)
+            steps += 1
+        return steps
+
     def draw(self):
-        self.screen.fill((255, 255, 255))
+        if self.dirty_rendering:
+            self._draw_dirty()
+            return
+        self.screen.blit(self.map.image, (0, 0))
         self.all_sprites.draw(self.screen)
         self.good_alert.draw(self.screen)
         self.warning_alert.draw(self.screen)
         self.bad_alert.draw(self.screen)
+        self.stats_overlay.draw(self.screen)
+        self.profiler.draw(self.screen)
         pg.display.flip()
+
+    def _draw_dirty(self):
+        """
+        Redraw only what changed since the last frame: sprites marked dirty and
+        the river strips the map updated, which are repainted from the map image.
+        """
+        for rect in self.map.changed_rects:
+            self.all_sprites.repaint_rect(rect)
+        pg.display.update(self.all_sprites.draw(self.screen, self.map.image))
@@ -0,0 +1,67 @@
+"""
+Constant-time move checks for the game loop.
+"""
+import threading
+from typing import List, Optional, Tuple
+
+from src.entities.puzzle import Puzzle
+from src.enums import MoveSafety, Shores
+from src.solver import Solver
+
+
+class Reachability:
+    """
+    One bit per state key telling whether the goal can still be reached from it.
+
+    Built once per puzzle from the solver's distance table, after which judging
+    a boat load is a bounds check, the safety rule and a bit lookup, cheap enough
+    to run every frame.
+    """
+
+    def __init__(self, puzzle: Puzzle, cancel_event: Optional[threading.Event] = None):
+        self.puzzle = puzzle
+        self.bits = bytearray((puzzle.state_space_size + 7) // 8)
+        for key in Solver.distance_table(puzzle, cancel_event).distances:
+            self.bits[key >> 3] |= 1 << (key & 7)
+
+    def can_reach_goal(self, key: int) -> bool:
+        return bool(self.bits[key >> 3] >> (key & 7) & 1)
+
+    def classify_move(self, key: int, missionaries: int, cannibals: int) -> MoveSafety:
+        """
+        What happens if the boat leaves the state with the given key carrying
+        that many missionaries and cannibals. Loads that are not on the boat's
+        bank are INVALID.
+        """
+        if missionaries + cannibals == 0:
+            return MoveSafety.EMPTY
+
+        puzzle = self.puzzle
+        m_left, c_left, boat_position = puzzle.decode(key)
+        if boat_position == Shores.LEFT:
+            new_m_left, new_c_left = m_left - missionaries, c_left - cannibals
+            new_boat_position = Shores.RIGHT
+        else:
+            new_m_left, new_c_left = m_left + missionaries, c_left + cannibals
+            new_boat_position = Shores.LEFT
+
+        if not puzzle.is_within_bounds(new_m_left, new_c_left):
+            return MoveSafety.INVALID
+        if not puzzle.is_safe(new_m_left, new_c_left):
+            return MoveSafety.FATAL
+        if not self.can_reach_goal(puzzle.encode(new_m_left, new_c_left, new_boat_position)):
+            return MoveSafety.DEAD_END
+        return MoveSafety.SAFE
+
+    def safe_loads(self, key: int) -> List[Tuple[int, int]]:
+        """
+        Every (missionaries, cannibals) load that keeps the goal reachable.
+        """
+        m_left, c_left, boat_position = self.puzzle.decode(key)
+        if boat_position == Shores.LEFT:
+            available_m, available_c = m_left, c_left
+        else:
+            available_m, available_c = self.puzzle.missionaries - m_left, self.puzzle.cannibals - c_left
+
+        return [(m, c) for m, c in self.puzzle.boat_loads
+                if m <= available_m and c <= available_c and self.classify_move(key, m, c) == MoveSafety.SAFE]
@@ -2,4 +2,15 @@
 
 DIMENSIONS = (1080, 720)
 FPS = 60
-ANTIALIASING = 4
\ No newline at end of file
+ANTIALIASING = 4
+DIRTY_RENDERING = True  # Redraw and update only the screen areas that changed
+SIMULATION_HZ = 60  # Fixed simulation steps per second, independent of the frame rate
+MAX_SIMULATION_STEPS = 5  # Steps caught up per frame at most; beyond that the game slows down
+MOVE_DURATION_MS = 400  # Time a boat or NPC takes to glide to its new place
+AUTOSOLVE_DELAYS = (1000, 500, 250, 125, 0)  # Autosolve speeds in ms between moves; 0 is max speed
+AUTOSOLVE_DELAY = 500  # Starting autosolve speed, one of AUTOSOLVE_DELAYS
+ADAPTIVE_FRAME_RATE = True  # Drop to IDLE_FPS while only the river moves
+IDLE_FPS = 15  # At least SIMULATION_HZ / MAX_SIMULATION_STEPS, or game time falls behind
+IDLE_AFTER_MS = 1000  # Time without input before the frame rate drops
+RIVER_FRAMES = 180  # Frames of the pre-rendered river loop, ~8.6 of them shown per second
+RIVER_CACHE_FRAMES = 180  # River frames kept, ~92 KB each as 8-bit strips (~370 KB without NumPy)
@@ -0,0 +1,64 @@
+"""
+Runs the solver on a background thread so the game loop keeps pumping events.
+"""
+import queue
+import threading
+from typing import Optional
+
+from src.entities.state import State
+from src.enums import SolverStrategy
+from src.solver import SearchStats, SolveCancelled, Solver
+
+
+class SolveWorker:
+    """
+    Solves from a state on a daemon thread and hands the solution over one state
+    at a time, so playback can start before the whole path is known.
+    """
+
+    def __init__(self, initial_state: State, strategy: SolverStrategy = SolverStrategy.TABLE):
+        self.initial_state = initial_state
+        self.strategy = strategy
+        self.stats = SearchStats()
+        self.cancel_event = threading.Event()
+        self.cancelled = False
+
+        self._states = queue.Queue()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="solver", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _run(self):
+        try:
+            for state in Solver.iter_solution(self.initial_state, self.stats, self.strategy, self.cancel_event):
+                self._states.put(state)
+        except SolveCancelled:
+            self.cancelled = True
+        finally:
+            self._done.set()
+
+    def cancel(self, timeout: Optional[float] = None):
+        """
+        Ask the search to stop and optionally wait for the thread to exit.
+        """
+        self.cancel_event.set()
+        if timeout is not None and self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def next_state(self) -> Optional[State]:
+        """
+        Next state of the solution if one is ready, without blocking.
+        """
+        try:
+            return self._states.get_nowait()
+        except queue.Empty:
+            return None
+
+    @property
+    def finished(self) -> bool:
+        """
+        True once the solver is done and every state has been handed over.
+        """
+        return self._done.is_set() and self._states.empty()
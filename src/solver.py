@@ -1,86 +1,866 @@
 """
 This module provides a solver for the missionaries and cannibals problem.
 """
-from typing import List, Tuple
-from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+from collections import OrderedDict, deque
+import threading
+import heapq
+import math
+import time
 
 from src.entities.state import State
-from src.enums import Shores
+from src.entities.puzzle import Puzzle, CLASSIC_PUZZLE
+from src.entities.rules import CrossingRules
+from src.enums import Shores, SolverStrategy
+from src.vectorized_solver import VectorizedSolver
+
+
+class SolveCancelled(Exception):
+    """
+    Raised inside a search when its cancel event is set.
+    """
+
+
+class SearchStats:
+    """
+    Counters filled in by a search when passed to Solver.solve_from_state().
+
+    nodes_generated: valid successor states produced
+    nodes_expanded: states whose successors were generated
+    duplicates_pruned: successors dropped because they had already been seen
+    invalid_rejected: successors dropped by the safety rule (State.is_valid)
+    peak_frontier: largest queue, heap or stack size reached
+    layer_times: seconds spent on each BFS layer (A*: each f value, IDA*: each threshold)
+
+    Counters are plain attribute increments and layer timings cost one clock read
+    per layer, so leaving stats out of a solve costs next to nothing.
+    """
+
+    def __init__(self):
+        self.nodes_generated = 0
+        self.nodes_expanded = 0
+        self.duplicates_pruned = 0
+        self.invalid_rejected = 0
+        self.peak_frontier = 0
+        self.layer_times: List[float] = []
+        self._layer_start: Optional[float] = None
+
+    def start_layer(self):
+        self._layer_start = time.perf_counter()
+
+    def end_layer(self):
+        if self._layer_start is not None:
+            self.layer_times.append(time.perf_counter() - self._layer_start)
+            self._layer_start = None
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.layer_times)
+
+    def as_dict(self) -> Dict:
+        return {
+            "nodes_generated": self.nodes_generated,
+            "nodes_expanded": self.nodes_expanded,
+            "duplicates_pruned": self.duplicates_pruned,
+            "invalid_rejected": self.invalid_rejected,
+            "peak_frontier": self.peak_frontier,
+            "layers": len(self.layer_times),
+            "layer_times": list(self.layer_times),
+        }
+
+    def __repr__(self):
+        return (f"SearchStats(generated={self.nodes_generated}, expanded={self.nodes_expanded}, "
+                f"duplicates={self.duplicates_pruned}, invalid={self.invalid_rejected}, "
+                f"peak_frontier={self.peak_frontier}, layers={len(self.layer_times)})")
+
+
+class DistanceTable:
+    """
+    Distance to the goal and best next state for every state that can reach the
+    goal, built with a single BFS backwards from the goal. Crossings are
+    reversible, so searching backwards uses the same successor function.
+    """
+
+    def __init__(self, puzzle: Puzzle, cancel_event: Optional[threading.Event] = None,
+                 stats: Optional[SearchStats] = None):
+        self.puzzle = puzzle
+        m_goal, c_goal = puzzle.goal_left
+        self.goal = puzzle.encode(m_goal, c_goal, puzzle.goal_shore)
+        self.distances: Dict[int, int] = {}
+        self.next_keys: Dict[int, int] = {}
+        # An unsafe goal can never be entered, so nothing reaches it and the table stays empty
+        if puzzle.is_safe(m_goal, c_goal):
+            self.distances[self.goal] = 0
+            self._build(cancel_event, stats if stats is not None else SearchStats())
+
+    def _build(self, cancel_event: Optional[threading.Event], stats: SearchStats):
+        queue = deque([self.goal])
+        layer = -1
+        while queue:
+            Solver.check_cancelled(cancel_event)
+            current = queue.popleft()
+            if self.distances[current] != layer:
+                stats.end_layer()
+                stats.start_layer()
+                layer = self.distances[current]
+
+            stats.nodes_expanded += 1
+            distance = layer + 1
+            for previous in Solver.get_next_keys(self.puzzle, current, stats):
+                if previous in self.distances:
+                    stats.duplicates_pruned += 1
+                    continue
+                self.distances[previous] = distance
+                self.next_keys[previous] = current
+                queue.append(previous)
+
+            if len(queue) > stats.peak_frontier:
+                stats.peak_frontier = len(queue)
+        stats.end_layer()
+
+    def distance(self, key: int) -> Optional[int]:
+        return self.distances.get(key)
+
+    def next_key(self, key: int) -> Optional[int]:
+        return self.next_keys.get(key)
+
+    def path_from(self, key: int) -> List[int]:
+        """
+        Keys from the given one to the goal, or an empty list if the goal cannot be reached.
+        """
+        return list(self.iter_path_from(key))
+
+    def iter_path_from(self, key: int) -> Iterator[int]:
+        """
+        Same as path_from() but one key at a time.
+        """
+        if key not in self.distances:
+            return
+        yield key
+        while key != self.goal:
+            key = self.next_keys[key]
+            yield key
+
+    def __len__(self):
+        return len(self.distances)
 
 
 class Solver:
+    # Distance tables of the most recently used puzzles, least recently used first out
+    max_distance_tables = 8
+    _distance_tables: "OrderedDict[Puzzle, DistanceTable]" = OrderedDict()
 
     @staticmethod
-    def solve_from_state(initial_state: State) -> List[State]:
+    def solve_from_state(initial_state: State, stats: Optional[SearchStats] = None,
+                         strategy: SolverStrategy = SolverStrategy.BFS,
+                         cancel_event: Optional[threading.Event] = None) -> List[State]:
         """
         Solve the missionaries and cannibals problem from the given initial state.
         Returns the sequence of states leading to the solution.
+
+        If cancel_event is given, the search stops with SolveCancelled soon after it is set.
         """
-        visited = set()
-        queue = deque()
-        queue.append((initial_state, []))
+        strategy = SolverStrategy(strategy)
+        if stats is None:
+            stats = SearchStats()
 
-        while queue:
-            current_state, path = queue.popleft()
+        if initial_state.is_objective():
+            return Solver.rebuild_path([initial_state])
+
+        if strategy == SolverStrategy.BIDIRECTIONAL:
+            return Solver._solve_bidirectional(initial_state, stats, cancel_event)
+        if strategy == SolverStrategy.TABLE:
+            return Solver._solve_with_table(initial_state, stats, cancel_event)
+        if strategy == SolverStrategy.ASTAR:
+            return Solver._solve_astar(initial_state, stats, cancel_event)
+        if strategy == SolverStrategy.IDASTAR:
+            return Solver._solve_idastar(initial_state, stats, cancel_event)
+        if strategy == SolverStrategy.CONSTRUCTIVE:
+            return Solver._solve_constructive(initial_state, stats, cancel_event)
+        if strategy == SolverStrategy.VECTORIZED:
+            keys = VectorizedSolver.solve(initial_state.puzzle, initial_state.key, stats,
+                                          lambda: Solver.check_cancelled(cancel_event))
+            return Solver.rebuild_path(Solver._keys_to_states(initial_state.puzzle, keys))
+        return Solver._solve_bfs(initial_state, stats, cancel_event)
+
+    @staticmethod
+    def solve_rules(rules: CrossingRules, stats: Optional[SearchStats] = None,
+                    cancel_event: Optional[threading.Event] = None) -> List[int]:
+        """
+        Solve a puzzle described by compiled CrossingRules. Returns the keys of a
+        shortest solution (see CrossingRules.describe()), or an empty list.
+        """
+        if stats is None:
+            stats = SearchStats()
+        return Solver._bfs_keys(rules.start_key, rules.goal_key, rules.next_keys, stats, cancel_event)
+
+    @staticmethod
+    def iter_solution(initial_state: State, stats: Optional[SearchStats] = None,
+                      strategy: SolverStrategy = SolverStrategy.BFS,
+                      cancel_event: Optional[threading.Event] = None) -> Iterator[State]:
+        """
+        Yield the solution one state at a time, counters already set.
+        With the table strategy states come out as the table is walked, so the
+        first moves are available before the rest of the path is built.
+        """
+        strategy = SolverStrategy(strategy)
+        if strategy != SolverStrategy.TABLE:
+            yield from Solver.solve_from_state(initial_state, stats, strategy, cancel_event)
+            return
+
+        puzzle = initial_state.puzzle
+        table = Solver.distance_table(puzzle, cancel_event, stats)
+        for counter, key in enumerate(table.iter_path_from(initial_state.key)):
+            Solver.check_cancelled(cancel_event)
+            if stats is not None:
+                stats.nodes_expanded += 1
+            yield Solver.state_from_key(puzzle, key, counter)
+
+    @staticmethod
+    def check_cancelled(cancel_event: Optional[threading.Event]):
+        if cancel_event is not None and cancel_event.is_set():
+            raise SolveCancelled()
+
+    @staticmethod
+    def distance_table(puzzle: Puzzle, cancel_event: Optional[threading.Event] = None,
+                       stats: Optional[SearchStats] = None) -> DistanceTable:
+        """
+        Reverse-BFS table for the puzzle, built on first use and cached afterwards.
+        Stats, if given, only receive numbers when the table is actually built.
+        """
+        table = Solver._distance_tables.get(puzzle)
+        if table is not None:
+            Solver._distance_tables.move_to_end(puzzle)
+            return table
+
+        table = DistanceTable(puzzle, cancel_event, stats)
+        Solver._distance_tables[puzzle] = table
+        if len(Solver._distance_tables) > Solver.max_distance_tables:
+            Solver._distance_tables.popitem(last=False)
+        return table
+
+    @staticmethod
+    def clear_distance_tables(puzzle: Optional[Puzzle] = None):
+        """
+        Drop the cached distance table of the given puzzle, or of every puzzle.
+        """
+        if puzzle is None:
+            Solver._distance_tables.clear()
+        else:
+            Solver._distance_tables.pop(puzzle, None)
+
+    @staticmethod
+    def distance_to_goal(state: State) -> Optional[int]:
+        """
+        Number of crossings left on an optimal solution, or None if the goal is unreachable.
+        """
+        return Solver.distance_table(state.puzzle).distance(state.key)
+
+    @staticmethod
+    def best_move(state: State) -> Optional[Tuple[int, int]]:
+        """
+        (missionaries, cannibals) to put on the boat next on an optimal solution,
+        or None at the goal or when the goal is unreachable.
+        """
+        puzzle = state.puzzle
+        next_key = Solver.distance_table(puzzle).next_key(state.key)
+        if next_key is None:
+            return None
+        m_left, c_left, _ = puzzle.decode(next_key)
+        return abs(state.missionaries_left - m_left), abs(state.cannibals_left - c_left)
+
+    @staticmethod
+    def _optimal_next_keys(table: DistanceTable, key: int) -> List[int]:
+        """
+        Successors one step closer to the goal, i.e. the edges of the optimal-path DAG.
+        """
+        distance = table.distance(key) - 1
+        return [next_key for next_key in Solver.get_next_keys(table.puzzle, key)
+                if table.distance(next_key) == distance]
+
+    @staticmethod
+    def iter_optimal_solutions(initial_state: State) -> Iterator[List[State]]:
+        """
+        Lazily yield every optimal solution from the given state, one path at a time.
+        Walks the layered DAG of the cached distance table depth first, so only the
+        current path is held in memory and callers can stop whenever they like.
+        """
+        puzzle = initial_state.puzzle
+        table = Solver.distance_table(puzzle)
+        start = initial_state.key
+        if table.distance(start) is None:
+            return
+
+        path = [start]
+        stack = [iter(Solver._optimal_next_keys(table, start))]
+        if start == table.goal:
+            stack.clear()
+            yield Solver.rebuild_path(Solver._keys_to_states(puzzle, path))
+
+        while stack:
+            next_key = next(stack[-1], None)
+            if next_key is None:
+                stack.pop()
+                path.pop()
+                continue
+
+            path.append(next_key)
+            if next_key == table.goal:
+                yield Solver.rebuild_path(Solver._keys_to_states(puzzle, path))
+                path.pop()
+                continue
+            stack.append(iter(Solver._optimal_next_keys(table, next_key)))
+
+    @staticmethod
+    def count_optimal_solutions(initial_state: State) -> int:
+        """
+        Number of distinct optimal solutions from the given state, without enumerating them.
+        Dynamic programming over the distance layers, nearest to the goal first.
+        Python ints do not overflow, so huge counts are exact.
+        """
+        table = Solver.distance_table(initial_state.puzzle)
+        start = initial_state.key
+        start_distance = table.distance(start)
+        if start_distance is None:
+            return 0
+
+        layers: List[List[int]] = [[] for _ in range(start_distance + 1)]
+        for key, distance in table.distances.items():
+            if distance <= start_distance:
+                layers[distance].append(key)
+
+        counts: Dict[int, int] = {table.goal: 1}
+        for layer in layers[1:]:
+            for key in layer:
+                counts[key] = sum(counts[next_key] for next_key in Solver._optimal_next_keys(table, key))
+        return counts[start]
+
+    @staticmethod
+    def iter_shortest_solutions(initial_state: State, k: Optional[int] = None) -> Iterator[List[State]]:
+        """
+        Lazily yield solutions that never repeat a state, shortest first, stopping after k if given.
+
+        Best-first search over partial paths ordered by length plus the exact
+        distance left, so complete paths come out in non-decreasing length. Partial
+        paths are stored as shared linked prefixes instead of copied lists.
+        """
+        puzzle = initial_state.puzzle
+        table = Solver.distance_table(puzzle)
+        start = initial_state.key
+        start_distance = table.distance(start)
+        if start_distance is None or k == 0:
+            return
+
+        found = 0
+        sequence = 0  # Tie-breaker so the heap never compares prefixes
+        # A prefix is (key, previous prefix)
+        heap = [(start_distance, 0, sequence, (start, None))]
+
+        while heap:
+            _, length, _, prefix = heapq.heappop(heap)
+            key = prefix[0]
+            if key == table.goal:
+                keys = []
+                while prefix is not None:
+                    keys.append(prefix[0])
+                    prefix = prefix[1]
+                keys.reverse()
+                yield Solver.rebuild_path(Solver._keys_to_states(puzzle, keys))
+                found += 1
+                if k is not None and found >= k:
+                    return
+                continue
+
+            for next_key in Solver.get_next_keys(puzzle, key):
+                if Solver._prefix_contains(prefix, next_key):
+                    continue
+                sequence += 1
+                estimate = length + 1 + table.distance(next_key)
+                heapq.heappush(heap, (estimate, length + 1, sequence, (next_key, prefix)))
+
+    @staticmethod
+    def _prefix_contains(prefix, key: int) -> bool:
+        while prefix is not None:
+            if prefix[0] == key:
+                return True
+            prefix = prefix[1]
+        return False
+
+    @staticmethod
+    def _solve_constructive(initial_state: State, stats: SearchStats,
+                            cancel_event: Optional[threading.Event]) -> List[State]:
+        """
+        Emit the constructed schedule when one applies, otherwise fall back to BFS.
+        """
+        puzzle = initial_state.puzzle
+        if initial_state.key != puzzle.encode(*puzzle.start_left, puzzle.start_shore):
+            return Solver._solve_bfs(initial_state, stats, cancel_event)
+        banks = Solver.constructive_schedule(puzzle)
+        if banks is None:
+            return Solver._solve_bfs(initial_state, stats, cancel_event)
+
+        stats.nodes_expanded += len(banks)
+        path = []
+        for counter, (m_left, c_left) in enumerate(banks):
+            boat_position = Shores.LEFT if counter % 2 == 0 else Shores.RIGHT
+            path.append(State(m_left, c_left, boat_position, counter, puzzle))
+        return path
+
+    @staticmethod
+    def constructive_length(puzzle: Puzzle) -> Optional[int]:
+        """
+        Number of crossings of the constructed schedule, in O(capacity²) time,
+        or None when no construction applies to the puzzle.
+        """
+        plan = Solver._constructive_plan(puzzle)
+        return plan[0] if plan is not None else None
+
+    @staticmethod
+    def constructive_schedule(puzzle: Puzzle) -> Optional[List[Tuple[int, int]]]:
+        """
+        Left bank (missionaries, cannibals) after every crossing of a solution
+        built without search, starting with the initial bank. The boat starts on
+        the left and alternates. Returns None when no construction applies.
+
+        Applies to N missionaries and N cannibals crossing left to right with at
+        least four seats. The schedule has three parts:
+          opening: ferry X cannibals over (k across, one back), then send Y
+                   missionaries and Y - X cannibals so both banks hold pairs;
+          middle:  one pair rows back, up to k // 2 pairs row over;
+          closing: the opening mirrored and played backwards.
+        The shortest combination of opening and closing sizes is picked, which
+        matches the BFS optimum on every instance checked (k 4-12, N 1-79).
+        """
+        plan = Solver._constructive_plan(puzzle)
+        if plan is None:
+            return None
+        _, opening_pairs, closing_pairs = plan
+        n = puzzle.missionaries
+        k = puzzle.boat_capacity
+
+        banks = Solver._opening_banks(n, k, opening_pairs)
+        if closing_pairs == 0:
+            return banks
+
+        # Middle: right bank goes from opening_pairs to n - closing_pairs + 1 pairs
+        target = n - closing_pairs + 1
+        right = opening_pairs
+        while right < target:
+            banks.append((n - right + 1, n - right + 1))
+            carried = min(k // 2, target - right + 1)
+            right += carried - 1
+            banks.append((n - right, n - right))
+        banks.append((n - right + 1, n - right + 1))
+
+        closing = Solver._opening_banks(n, k, closing_pairs)
+        banks.extend((n - m_left, n - c_left) for m_left, c_left in reversed(closing[:-1]))
+        return banks
 
-            state_id = (current_state.missionaries_left, current_state.cannibals_left, current_state.boat_position)
-            if state_id in visited:
+    @staticmethod
+    def _constructive_plan(puzzle: Puzzle) -> Optional[Tuple[int, int, int]]:
+        """
+        (crossings, opening pairs, closing pairs) of the shortest constructed
+        schedule; closing pairs is 0 when the opening alone reaches the goal.
+        """
+        n = puzzle.missionaries
+        k = puzzle.boat_capacity
+        if (n != puzzle.cannibals or k < 4 or puzzle.start_shore != Shores.LEFT
+                or puzzle.goal_shore != Shores.RIGHT):
+            return None
+        if n == 0:
+            return 0, 0, 0
+
+        best = None
+        if n <= k:
+            direct = Solver._opening_length(n, k, n)
+            if direct is not None:
+                best = (direct, n, 0)
+
+        step = k // 2 - 1
+        sizes = [(y, Solver._opening_length(n, k, y)) for y in range(1, min(k, n) + 1)]
+        for opening_pairs, opening in sizes:
+            if opening is None:
                 continue
-            visited.add(state_id)
+            for closing_pairs, closing in sizes:
+                target = n - closing_pairs + 1
+                if closing is None or target < opening_pairs:
+                    continue
+                crossings = opening + 1 + 2 * -(-(target - opening_pairs) // step) + closing
+                if best is None or crossings < best[0]:
+                    best = (crossings, opening_pairs, closing_pairs)
+        return best
+
+    @staticmethod
+    def _opening_length(n: int, k: int, pairs: int) -> Optional[int]:
+        """
+        Crossings needed to leave `pairs` missionary-cannibal pairs on the right bank.
+        """
+        ferried = max(0, 2 * pairs - k)
+        if ferried and ferried >= n:
+            return None  # The last ferry trip would need a cannibal that is not there
+        return 2 * -(-ferried // (k - 1)) + 1
+
+    @staticmethod
+    def _opening_banks(n: int, k: int, pairs: int) -> List[Tuple[int, int]]:
+        ferried = max(0, 2 * pairs - k)
+        c_left = n
+        banks = [(n, c_left)]
+        while n - c_left < ferried:
+            c_left -= min(k, ferried - (n - c_left) + 1)
+            banks.append((n, c_left))
+            c_left += 1
+            banks.append((n, c_left))
+        banks.append((n - pairs, n - pairs))
+        return banks
+
+    @staticmethod
+    def _solve_with_table(initial_state: State, stats: SearchStats,
+                          cancel_event: Optional[threading.Event]) -> List[State]:
+        """
+        Walk the cached distance table from the given state; no search after the first call.
+        """
+        puzzle = initial_state.puzzle
+        keys = Solver.distance_table(puzzle, cancel_event, stats).path_from(initial_state.key)
+        stats.nodes_expanded += len(keys)
+        return Solver.rebuild_path(Solver._keys_to_states(puzzle, keys))
+
+    @staticmethod
+    def _solve_bfs(initial_state: State, stats: SearchStats,
+                   cancel_event: Optional[threading.Event]) -> List[State]:
+        """
+        BFS over compact state keys keeping a single predecessor map, so the
+        path is only materialized once the goal is reached.
+        """
+        puzzle = initial_state.puzzle
+        m_goal, c_goal = puzzle.goal_left
+        goal = puzzle.encode(m_goal, c_goal, puzzle.goal_shore)
+
+        def next_keys(key, stats):
+            return Solver.get_next_keys(puzzle, key, stats)
+
+        keys = Solver._bfs_keys(initial_state.key, goal, next_keys, stats, cancel_event)
+        return Solver.rebuild_path(Solver._keys_to_states(puzzle, keys))
+
+    @staticmethod
+    def _bfs_keys(start: int, goal: int, next_keys, stats: SearchStats,
+                  cancel_event: Optional[threading.Event]) -> List[int]:
+        """
+        Layered BFS over integer keys, shared by puzzles and compiled rule sets.
+        next_keys(key, stats) returns the valid successors of a key.
+        """
+        if start == goal:
+            return [start]
+
+        parents: Dict[int, Optional[int]] = {start: None}
+        frontier = [start]
+
+        while frontier:
+            stats.start_layer()
+            next_frontier = []
+            for current in frontier:
+                Solver.check_cancelled(cancel_event)
+                stats.nodes_expanded += 1
+
+                for next_key in next_keys(current, stats):
+                    if next_key in parents:
+                        stats.duplicates_pruned += 1
+                        continue
+                    parents[next_key] = current
+
+                    if next_key == goal:
+                        stats.end_layer()
+                        return Solver._walk_parents(parents, next_key)
+
+                    next_frontier.append(next_key)
+
+            stats.end_layer()
+            frontier = next_frontier
+            if len(frontier) > stats.peak_frontier:
+                stats.peak_frontier = len(frontier)
+
+        return []
+
+    @staticmethod
+    def _solve_bidirectional(initial_state: State, stats: SearchStats,
+                             cancel_event: Optional[threading.Event]) -> List[State]:
+        """
+        BFS from the start and from the goal at the same time, one full layer at a
+        time on the smaller side, until the two searches meet. Crossings are
+        reversible, so the backward search uses the same successor function.
+        """
+        puzzle = initial_state.puzzle
+        start = initial_state.key
+        m_goal, c_goal = puzzle.goal_left
+        goal = puzzle.encode(m_goal, c_goal, puzzle.goal_shore)
+        if not puzzle.is_safe(m_goal, c_goal):
+            return []  # The goal can never be entered, so there is nothing to meet
+
+        forward_parents: Dict[int, Optional[int]] = {start: None}
+        backward_parents: Dict[int, Optional[int]] = {goal: None}
+        forward_frontier = [start]
+        backward_frontier = [goal]
+
+        while forward_frontier and backward_frontier:
+            stats.start_layer()
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier, meeting = Solver._expand_layer(
+                    puzzle, forward_frontier, forward_parents, backward_parents, stats, cancel_event)
+            else:
+                backward_frontier, meeting = Solver._expand_layer(
+                    puzzle, backward_frontier, backward_parents, forward_parents, stats, cancel_event)
+            stats.end_layer()
+
+            if meeting is not None:
+                keys = Solver._walk_parents(forward_parents, meeting)
+                keys += reversed(Solver._walk_parents(backward_parents, meeting)[:-1])
+                return Solver.rebuild_path(Solver._keys_to_states(puzzle, keys))
+
+            frontier_size = len(forward_frontier) + len(backward_frontier)
+            if frontier_size > stats.peak_frontier:
+                stats.peak_frontier = frontier_size
+
+        return []
+
+    @staticmethod
+    def _expand_layer(puzzle: Puzzle, frontier: List[int], parents: Dict[int, Optional[int]],
+                      other_parents: Dict[int, Optional[int]], stats: SearchStats,
+                      cancel_event: Optional[threading.Event]):
+        """
+        Expand a whole BFS layer. Returns the next layer and a key seen by both
+        searches, or None. Finishing the layer before stopping keeps the meeting
+        point on a shortest path.
+        """
+        next_frontier = []
+        meeting = None
+        for key in frontier:
+            Solver.check_cancelled(cancel_event)
+            stats.nodes_expanded += 1
+            for next_key in Solver.get_next_keys(puzzle, key, stats):
+                if next_key in parents:
+                    stats.duplicates_pruned += 1
+                    continue
+                parents[next_key] = key
+                if meeting is None and next_key in other_parents:
+                    meeting = next_key
+                next_frontier.append(next_key)
+        return next_frontier, meeting
+
+    @staticmethod
+    def heuristic(puzzle: Puzzle, key: int) -> int:
+        """
+        Lower bound on the crossings left from the given key. Every trip towards
+        the goal carries at most boat_capacity people and every trip back brings
+        at least one of them back, ignoring the safety rule, so it never
+        overestimates.
+        """
+        m_left, c_left, boat_position = puzzle.decode(key)
+        m_goal, c_goal = puzzle.goal_left
+        remaining = abs(m_left - m_goal) + abs(c_left - c_goal)
+        if remaining == 0:
+            return 0
+
+        capacity = puzzle.boat_capacity
+        extra = 0
+        if boat_position == puzzle.goal_shore:
+            # Someone has to bring the boat back first
+            extra = 1
+            remaining += 1
+
+        if remaining <= capacity:
+            return extra + 1
+        if capacity == 1:
+            # Unsolvable, any finite bound is still admissible
+            return extra + 2 * remaining - 1
+        round_trips = math.ceil((remaining - capacity) / (capacity - 1))
+        return extra + 2 * round_trips + 1
+
+    @staticmethod
+    def _solve_astar(initial_state: State, stats: SearchStats,
+                     cancel_event: Optional[threading.Event]) -> List[State]:
+        """
+        A* over state keys with a binary heap ordered by g + heuristic.
+        Ties prefer deeper nodes so the goal is reached with fewer expansions.
+        """
+        puzzle = initial_state.puzzle
+        start = initial_state.key
+
+        parents: Dict[int, Optional[int]] = {start: None}
+        costs: Dict[int, int] = {start: 0}
+        heap = [(Solver.heuristic(puzzle, start), 0, start)]
+        layer = None
+
+        while heap:
+            Solver.check_cancelled(cancel_event)
+            estimate, negative_cost, current = heapq.heappop(heap)
+            cost = -negative_cost
+            if cost > costs[current]:
+                stats.duplicates_pruned += 1
+                continue  # Stale heap entry
 
-            if current_state.is_objective():
-                # Rebuild the path to include counters for animation
-                return Solver.rebuild_path(path + [current_state])
+            if estimate != layer:
+                stats.end_layer()
+                stats.start_layer()
+                layer = estimate
 
-            for next_state in Solver.get_next_states(current_state):
-                queue.append((next_state, path + [current_state]))
+            m_left, c_left, _ = puzzle.decode(current)
+            if puzzle.is_goal(m_left, c_left):
+                stats.end_layer()
+                return Solver.rebuild_path(Solver._keys_to_states(puzzle, Solver._walk_parents(parents, current)))
 
+            stats.nodes_expanded += 1
+            next_cost = cost + 1
+            for next_key in Solver.get_next_keys(puzzle, current, stats):
+                if next_cost >= costs.get(next_key, next_cost + 1):
+                    stats.duplicates_pruned += 1
+                    continue
+                costs[next_key] = next_cost
+                parents[next_key] = current
+                heapq.heappush(heap, (next_cost + Solver.heuristic(puzzle, next_key), -next_cost, next_key))
+
+            if len(heap) > stats.peak_frontier:
+                stats.peak_frontier = len(heap)
+
+        stats.end_layer()
         return []
 
+    @staticmethod
+    def _solve_idastar(initial_state: State, stats: SearchStats,
+                       cancel_event: Optional[threading.Event]) -> List[State]:
+        """
+        Iterative-deepening A*: repeated depth-first searches bounded by g + heuristic.
+        Memory is limited to the current path, at the price of re-expanding states.
+        """
+        puzzle = initial_state.puzzle
+        start = initial_state.key
+        threshold = Solver.heuristic(puzzle, start)
+
+        while True:
+            stats.start_layer()
+            path, next_threshold = Solver._bounded_search(puzzle, start, threshold, stats, cancel_event)
+            stats.end_layer()
+            if path:
+                return Solver.rebuild_path(Solver._keys_to_states(puzzle, path))
+            if next_threshold == math.inf:
+                return []
+            threshold = next_threshold
+
+    @staticmethod
+    def _bounded_search(puzzle: Puzzle, start: int, threshold: int, stats: SearchStats,
+                        cancel_event: Optional[threading.Event]):
+        """
+        One IDA* iteration, written with an explicit stack because solution paths
+        on big instances are longer than Python's recursion limit. Returns the
+        path if the goal was found and the smallest f value over the threshold.
+        """
+        path = [start]
+        on_path = {start}
+        stack = [iter(Solver.get_next_keys(puzzle, start, stats))]
+        stats.nodes_expanded += 1
+        next_threshold = math.inf
+
+        while stack:
+            Solver.check_cancelled(cancel_event)
+            next_key = next(stack[-1], None)
+            if next_key is None:
+                stack.pop()
+                on_path.discard(path.pop())
+                continue
+            if next_key in on_path:
+                stats.duplicates_pruned += 1
+                continue
+
+            estimate = len(path) + Solver.heuristic(puzzle, next_key)
+            if estimate > threshold:
+                next_threshold = min(next_threshold, estimate)
+                continue
+
+            path.append(next_key)
+            on_path.add(next_key)
+            m_left, c_left, _ = puzzle.decode(next_key)
+            if puzzle.is_goal(m_left, c_left):
+                return path, next_threshold
+
+            stats.nodes_expanded += 1
+            stack.append(iter(Solver.get_next_keys(puzzle, next_key, stats)))
+            if len(stack) > stats.peak_frontier:
+                stats.peak_frontier = len(stack)
+
+        return None, next_threshold
+
+    @staticmethod
+    def _walk_parents(parents: Dict[int, Optional[int]], key: int) -> List[int]:
+        """
+        Follow predecessor links back to the start and return the keys in travel order.
+        """
+        keys = []
+        while key is not None:
+            keys.append(key)
+            key = parents[key]
+        keys.reverse()
+        return keys
+
+    @staticmethod
+    def _keys_to_states(puzzle: Puzzle, keys: List[int]) -> List[State]:
+        return [Solver.state_from_key(puzzle, key) for key in keys]
+
+    @staticmethod
+    def state_from_key(puzzle: Puzzle, key: int, counter: int = 0) -> State:
+        m_left, c_left, boat_position = puzzle.decode(key)
+        return State(m_left, c_left, boat_position, counter, puzzle)
+
     @staticmethod
     def rebuild_path(path: List[State]) -> List[State]:
         """
         Sets the counter properly in the solution path.
         """
-        new_path = []
-        for i, state in enumerate(path):
-            state.counter = i
-            new_path.append(state)
-        return new_path
+        return [state.with_counter(i) for i, state in enumerate(path)]
 
     @staticmethod
-    def get_next_states(current_state: State) -> List[State]:
+    def get_next_keys(puzzle: Puzzle, key: int, stats: Optional[SearchStats] = None) -> List[int]:
         """
-        Generate all possible next valid states from the current state.
+        Keys of every valid state reachable from the given key in one crossing.
+        Only boat loads that fit the puzzle's boat and the people on the departing bank are tried.
         """
-        next_states = []
-        for m in range(3):
-            for c in range(3):
-                if m + c == 0 or m + c > 2:
-                    continue
+        m_left, c_left, boat_position = puzzle.decode(key)
+
+        if boat_position == Shores.LEFT:
+            available_m = m_left
+            available_c = c_left
+            direction = -1
+            new_boat_position = Shores.RIGHT
+        else:
+            available_m = puzzle.missionaries - m_left
+            available_c = puzzle.cannibals - c_left
+            direction = 1
+            new_boat_position = Shores.LEFT
 
-                if current_state.boat_position == Shores.LEFT:
-                    new_m_left = current_state.missionaries_left - m
-                    new_c_left = current_state.cannibals_left - c
-                    new_boat_position = Shores.RIGHT
-                else:
-                    new_m_left = current_state.missionaries_left + m
-                    new_c_left = current_state.cannibals_left + c
-                    new_boat_position = Shores.LEFT
+        next_keys = []
+        rejected = 0
+        for m, c in puzzle.boat_loads:
+            if m > available_m or c > available_c:
+                continue
 
-                new_state = State(
-                    missionaries_left=new_m_left,
-                    cannibals_left=new_c_left,
-                    objective_state=current_state.objective_state,
-                    boat_position=new_boat_position,
-                    counter=0  # Will be set in rebuild_path()
-                )
+            new_m_left = m_left + direction * m
+            new_c_left = c_left + direction * c
 
-                if new_state.is_valid() and Solver.is_within_bounds(new_m_left, new_c_left):
-                    next_states.append(new_state)
+            if puzzle.is_safe(new_m_left, new_c_left):
+                next_keys.append(puzzle.encode(new_m_left, new_c_left, new_boat_position))
+            else:
+                rejected += 1
 
-        return next_states
+        if stats is not None:
+            stats.nodes_generated += len(next_keys)
+            stats.invalid_rejected += rejected
+        return next_keys
+
+    @staticmethod
+    def get_next_states(current_state: State) -> List[State]:
+        """
+        Generate all possible next valid states from the current state.
+        """
+        puzzle = current_state.puzzle
+        return [Solver.state_from_key(puzzle, key) for key in Solver.get_next_keys(puzzle, current_state.key)]
 
     @staticmethod
-    def is_within_bounds(m_left, c_left) -> bool:
-        return 0 <= m_left <= 3 and 0 <= c_left <= 3
+    def is_within_bounds(m_left, c_left, puzzle: Puzzle = CLASSIC_PUZZLE) -> bool:
+        return puzzle.is_within_bounds(m_left, c_left)
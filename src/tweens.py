@@ -0,0 +1,112 @@
+"""
+Tweens that glide sprites between positions on the simulation clock.
+
+The game advances the scheduler in fixed simulation steps, so an animation
+takes the same game time whatever the frame rate is. Before drawing, apply()
+places every sprite where it is at the render time, between two steps.
+"""
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+
+def smoothstep(t: float) -> float:
+    return t * t * (3 - 2 * t)
+
+
+class Tween:
+    """
+    One straight glide of a sprite's rect.topleft.
+    """
+
+    def __init__(self, target: Tuple[int, int], duration: float):
+        self.start = None  # Known once the tween begins, after the ones before it
+        self.target = target
+        self.duration = duration
+        self.elapsed = 0.0
+
+    def position(self, elapsed: float) -> Tuple[int, int]:
+        t = smoothstep(min(1.0, elapsed / self.duration))
+        (x0, y0), (x1, y1) = self.start, self.target
+        return round(x0 + (x1 - x0) * t), round(y0 + (y1 - y0) * t)
+
+
+class TweenScheduler:
+    """
+    Queues of tweens per sprite. A sprite's moves play one after the other,
+    so a passenger first rides the boat across and then steps ashore.
+    """
+
+    def __init__(self, duration: float):
+        self.duration = duration  # Milliseconds per move, 0 moves instantly
+        self._queues: Dict[object, Deque[Tween]] = {}
+
+    def __len__(self):
+        return len(self._queues)
+
+    def move(self, sprite, target: Tuple[int, int]):
+        """
+        Glide sprite to target after its queued moves, or put it there right
+        away when moves are instant.
+        """
+        target = tuple(target)
+        queue = self._queues.get(sprite)
+        if queue is None:
+            if tuple(sprite.rect.topleft) == target:
+                return
+            if self.duration <= 0:
+                self._place(sprite, target)
+                return
+            queue = self._queues[sprite] = deque()
+        elif queue[-1].target == target:
+            return
+        elif self.duration <= 0:
+            # Moves became instant while this sprite was gliding
+            del self._queues[sprite]
+            self._place(sprite, target)
+            return
+        queue.append(Tween(target, self.duration))
+
+    def update(self, step: float):
+        """
+        Advance every sprite's current tween by one simulation step of `step` ms,
+        carrying leftover time into the next tween of the same sprite.
+        """
+        for sprite in list(self._queues):
+            queue = self._queues[sprite]
+            remaining = step
+            while queue:
+                tween = queue[0]
+                if tween.start is None:
+                    tween.start = tuple(sprite.rect.topleft)
+                tween.elapsed += remaining
+                if tween.elapsed < tween.duration:
+                    break
+                remaining = tween.elapsed - tween.duration
+                queue.popleft()
+                self._place(sprite, tween.target)
+            if not queue:
+                del self._queues[sprite]
+
+    def apply(self, lead: float = 0.0):
+        """
+        Move the sprites to where their tweens are `lead` ms after the last
+        step, interpolating between simulation steps for smooth rendering.
+        """
+        for sprite, queue in self._queues.items():
+            tween = queue[0]
+            if tween.start is not None:
+                self._place(sprite, tween.position(tween.elapsed + lead))
+
+    def finish(self):
+        """
+        Jump every sprite to its final destination and drop all tweens.
+        """
+        for sprite, queue in self._queues.items():
+            self._place(sprite, queue[-1].target)
+        self._queues.clear()
+
+    @staticmethod
+    def _place(sprite, position: Tuple[int, int]):
+        if sprite.rect.topleft != position:
+            sprite.rect.topleft = position
+            sprite.dirty = 1
@@ -0,0 +1,107 @@
+"""
+NumPy backend for the missionaries and cannibals solver.
+
+States use the same integer keys as Puzzle.encode(). A whole BFS layer is expanded
+at once by broadcasting the frontier against every boat load, invalid states are
+dropped with array masks and a visited map indexed by key removes duplicates.
+"""
+from typing import Callable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for this backend
+    np = None
+
+from src.entities.puzzle import Puzzle
+
+
+class VectorizedSolver:
+
+    @staticmethod
+    def is_available() -> bool:
+        return np is not None
+
+    @staticmethod
+    def solve(puzzle: Puzzle, start: int, stats, check_cancelled: Optional[Callable[[], None]] = None) -> List[int]:
+        """
+        Layer-by-layer BFS from the start key. Returns the keys of a shortest path
+        to the goal, or an empty list if there is none. check_cancelled is called
+        once per layer and may raise to abort the search.
+        """
+        if np is None:
+            raise RuntimeError("The vectorized solver needs numpy installed.")
+
+        m_goal, c_goal = puzzle.goal_left
+        goal = puzzle.encode(m_goal, c_goal, puzzle.goal_shore)
+        if start == goal:
+            return [start]
+
+        total_m = puzzle.missionaries
+        total_c = puzzle.cannibals
+        stride = total_c + 1
+
+        loads = np.array(puzzle.boat_loads, dtype=np.int64).reshape(-1, 2)
+        load_m = loads[:, 0][np.newaxis, :]
+        load_c = loads[:, 1][np.newaxis, :]
+
+        visited = np.zeros(puzzle.state_space_size, dtype=bool)
+        parents = np.full(puzzle.state_space_size, -1, dtype=np.int64)
+        visited[start] = True
+        frontier = np.array([start], dtype=np.int64)
+
+        while frontier.size:
+            if check_cancelled is not None:
+                check_cancelled()
+            stats.start_layer()
+            stats.nodes_expanded += int(frontier.size)
+
+            boat = frontier & 1
+            bank = frontier >> 1
+            m_left = (bank // stride)[:, np.newaxis]
+            c_left = (bank % stride)[:, np.newaxis]
+            # Boat on the left takes people away from the left bank, on the right it brings them back
+            direction = np.where(boat == 0, -1, 1)[:, np.newaxis]
+
+            new_m = m_left + direction * load_m
+            new_c = c_left + direction * load_c
+            new_m_right = total_m - new_m
+            new_c_right = total_c - new_c
+
+            in_bounds = (new_m >= 0) & (new_m <= total_m) & (new_c >= 0) & (new_c <= total_c)
+            mask = in_bounds & ~((new_c > new_m) & (new_m > 0))
+            mask &= ~((new_c_right > new_m_right) & (new_m_right > 0))
+
+            new_keys = (new_m * stride + new_c) * 2 + (1 - boat)[:, np.newaxis]
+            from_keys = np.broadcast_to(frontier[:, np.newaxis], new_keys.shape)
+
+            candidates = new_keys[mask]
+            sources = from_keys[mask]
+            unseen = ~visited[candidates]
+            generated = int(candidates.size)
+            candidates, first = np.unique(candidates[unseen], return_index=True)
+            sources = sources[unseen][first]
+
+            stats.nodes_generated += generated
+            stats.invalid_rejected += int(np.count_nonzero(in_bounds)) - generated
+            stats.duplicates_pruned += generated - int(candidates.size)
+
+            visited[candidates] = True
+            parents[candidates] = sources
+            stats.end_layer()
+
+            if visited[goal]:
+                return VectorizedSolver._walk_parents(parents, start, goal)
+
+            frontier = candidates
+            if frontier.size > stats.peak_frontier:
+                stats.peak_frontier = int(frontier.size)
+
+        return []
+
+    @staticmethod
+    def _walk_parents(parents, start: int, goal: int) -> List[int]:
+        keys = [goal]
+        while keys[-1] != start:
+            keys.append(int(parents[keys[-1]]))
+        keys.reverse()
+        return keys
@@ -0,0 +1,12 @@
+from src.batch import solve_job
+from src.enums import SolverStrategy
+from src.solver import Solver
+
+
+def test_table_jobs_do_not_keep_their_distance_tables():
+    Solver.clear_distance_tables()
+    for people in range(3, 8):
+        result = solve_job({"missionaries": people, "cannibals": people, "boat_capacity": 4,
+                            "strategy": SolverStrategy.TABLE.value})
+        assert result["solvable"]
+    assert not Solver._distance_tables
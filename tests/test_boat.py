@@ -0,0 +1,27 @@
+import pygame as pg
+
+from src.entities.boat import Boat
+from src.entities.npc import NPC
+from src.enums import NPCType, Shores
+
+
+def test_boards_and_unboards_more_than_two_passengers():
+    screen = pg.Surface((400, 300))
+    boat = Boat(left_pos=(100, 150), right_pos=(250, 150), start_pos=Shores.LEFT,
+                dimensions=(90, 30), capacity=3)
+    npcs = [NPC((350, 100 + 20 * i), (10, 100 + 20 * i), (20, 40), npc_type, Shores.LEFT, screen)
+            for i, npc_type in enumerate((NPCType.MISSIONARY, NPCType.CANNIBAL, NPCType.CANNIBAL))]
+
+    for npc in npcs:
+        assert boat.add_passenger(npc)
+    assert not boat.add_passenger(NPC((350, 0), (10, 0), (20, 40), NPCType.MISSIONARY, Shores.LEFT, screen))
+
+    # Every seat is on the boat, each one further right
+    seats = [npc.rect.left for npc in npcs]
+    assert seats == sorted(seats)
+    assert all(boat.left_pos[0] <= x < boat.left_pos[0] + boat.rect.width for x in seats)
+
+    assert boat.remove_passenger(npcs[0])
+    assert boat.passengers == npcs[1:]
+    assert [npc.rect.left for npc in boat.passengers] == seats[:2]
+    assert npcs[0].rect.topleft == (10, 100)
@@ -0,0 +1,51 @@
+import pytest
+
+from src.entities.puzzle import Puzzle
+from src.entities.state import State
+from src.enums import Shores, SolverStrategy
+from src.solver import Solver
+
+
+def assert_legal_solution(puzzle, path):
+    assert path[0].key == puzzle.encode(*puzzle.start_left, puzzle.start_shore)
+    assert path[-1].is_objective()
+    for counter, (state, next_state) in enumerate(zip(path, path[1:])):
+        assert next_state.key in Solver.get_next_keys(puzzle, state.key)
+        assert next_state.counter == counter + 1
+
+
+@pytest.mark.parametrize("capacity", range(4, 9))
+@pytest.mark.parametrize("people", range(41))
+def test_schedule_is_a_legal_optimal_solution(people, capacity):
+    puzzle = Puzzle(people, people, capacity)
+    start = State(*puzzle.start_left, puzzle.start_shore, puzzle=puzzle)
+
+    path = Solver.solve_from_state(start, strategy=SolverStrategy.CONSTRUCTIVE)
+    optimal = Solver.solve_from_state(start, strategy=SolverStrategy.BFS)
+
+    assert_legal_solution(puzzle, path)
+    assert len(path) == len(optimal)
+    assert Solver.constructive_length(puzzle) == len(optimal) - 1
+
+
+@pytest.mark.parametrize("puzzle", [Puzzle(3, 3, 2), Puzzle(5, 5, 3), Puzzle(5, 4, 4), Puzzle(4, 5, 4)])
+def test_falls_back_to_bfs_when_no_construction_applies(puzzle):
+    assert Solver.constructive_length(puzzle) is None
+    assert Solver.constructive_schedule(puzzle) is None
+
+    start = State(*puzzle.start_left, puzzle.start_shore, puzzle=puzzle)
+    path = Solver.solve_from_state(start, strategy=SolverStrategy.CONSTRUCTIVE)
+    assert path == Solver.solve_from_state(start, strategy=SolverStrategy.BFS)
+    if path:
+        assert_legal_solution(puzzle, path)
+
+
+def test_falls_back_to_bfs_away_from_the_initial_state():
+    puzzle = Puzzle(6, 6, 4)
+    state = State(4, 4, Shores.LEFT, puzzle=puzzle)
+    assert Solver.constructive_length(puzzle) is not None
+
+    path = Solver.solve_from_state(state, strategy=SolverStrategy.CONSTRUCTIVE)
+    assert path[0].key == state.key
+    assert path[-1].is_objective()
+    assert len(path) == len(Solver.solve_from_state(state, strategy=SolverStrategy.BFS))
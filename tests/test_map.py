@@ -0,0 +1,33 @@
+import pygame as pg
+import pytest
+
+from src.entities.map import Map
+from src.entities.vectorized_river import VectorizedRiver
+
+
+def make_map(vectorized):
+    return Map(size=(360, 120), land_color=(0, 128, 0), water_color=(0, 0, 255), shore_color=(139, 69, 19),
+               river_width=120, wavy_frequency=10, wavy_amplitude=10, shore_width=30,
+               animation_frames=12, vectorized=vectorized)
+
+
+@pytest.mark.parametrize("vectorized", [False, pytest.param(True, marks=pytest.mark.skipif(
+    not VectorizedRiver.is_available(), reason="needs numpy"))])
+def test_cached_strips_match_a_full_redraw(vectorized):
+    landscape = make_map(vectorized)
+    reference = make_map(vectorized)
+    reference.shore_phase_offset_left = landscape.shore_phase_offset_left
+    reference.shore_phase_offset_right = landscape.shore_phase_offset_right
+
+    for loop in range(2):  # Rendered on the first loop, blitted from the cache on the second
+        for index in range(landscape.animation_frames):
+            landscape._show_frame(index)
+            reference.counter = index * landscape.period / landscape.animation_frames
+            full = reference._generate_landscape()
+            for rect in landscape.animated_strips():
+                assert pg.image.tobytes(landscape.image.subsurface(rect), "RGB") == \
+                       pg.image.tobytes(full.subsurface(rect), "RGB")
+
+    assert len(landscape._frames) == landscape.animation_frames
+    if VectorizedRiver.is_available():  # NumPy also packs the strips into 8 bits
+        assert all(strip.get_bitsize() == 8 for strips in landscape._frames.values() for strip in strips)
@@ -0,0 +1,30 @@
+from src.entities.puzzle import Puzzle
+from src.enums import MoveSafety, Shores
+from src.reachability import Reachability
+
+
+def test_loads_not_on_the_boats_bank_are_invalid():
+    puzzle = Puzzle()
+    reachability = Reachability(puzzle)
+
+    start = puzzle.encode(3, 3, Shores.LEFT)
+    assert reachability.classify_move(start, 0, 4) == MoveSafety.INVALID
+
+    # Two cannibals across, boat on the right: nobody else is there to carry
+    key = puzzle.encode(3, 1, Shores.RIGHT)
+    assert reachability.classify_move(key, 1, 0) == MoveSafety.INVALID
+    assert reachability.classify_move(key, 0, 1) == MoveSafety.SAFE
+
+
+def test_no_move_is_safe_when_the_goal_is_unsafe():
+    puzzle = Puzzle(1, 2, 2)
+    reachability = Reachability(puzzle)
+
+    start = puzzle.encode(0, 1, Shores.RIGHT)
+    assert reachability.classify_move(start, 1, 1) != MoveSafety.SAFE
+    for m_left in range(puzzle.missionaries + 1):
+        for c_left in range(puzzle.cannibals + 1):
+            for shore in Shores:
+                key = puzzle.encode(m_left, c_left, shore)
+                for m, c in puzzle.boat_loads:
+                    assert reachability.classify_move(key, m, c) != MoveSafety.SAFE
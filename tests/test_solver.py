@@ -0,0 +1,42 @@
+from src.entities.puzzle import Puzzle
+from src.entities.state import State
+from src.enums import Shores, SolverStrategy
+from src.solver import Solver
+
+
+def test_bidirectional_does_not_solve_towards_an_unsafe_goal():
+    # One missionary stays with two cannibals on the goal bank
+    puzzle = Puzzle(1, 2, 2)
+    assert not puzzle.is_safe(*puzzle.goal_left)
+
+    for state in (State(0, 1, Shores.RIGHT, puzzle=puzzle), State(1, 1, Shores.LEFT, puzzle=puzzle)):
+        assert Solver.solve_from_state(state, strategy=SolverStrategy.BFS) == []
+        assert Solver.solve_from_state(state, strategy=SolverStrategy.BIDIRECTIONAL) == []
+
+
+def test_distance_table_is_empty_when_the_goal_is_unsafe():
+    puzzle = Puzzle(1, 2, 2)
+    state = State(0, 1, Shores.RIGHT, puzzle=puzzle)
+
+    assert len(Solver.distance_table(puzzle)) == 0
+    assert Solver.solve_from_state(state, strategy=SolverStrategy.TABLE) == []
+    assert Solver.distance_to_goal(state) is None
+    assert Solver.best_move(state) is None
+    assert list(Solver.iter_optimal_solutions(state)) == []
+    assert Solver.count_optimal_solutions(state) == 0
+
+
+def test_distance_table_cache_is_bounded():
+    Solver.clear_distance_tables()
+    puzzles = [Puzzle(people, people, 4) for people in range(Solver.max_distance_tables + 3)]
+    for puzzle in puzzles:
+        Solver.distance_table(puzzle)
+
+    assert len(Solver._distance_tables) == Solver.max_distance_tables
+    assert puzzles[0] not in Solver._distance_tables
+    assert puzzles[-1] in Solver._distance_tables
+
+    Solver.clear_distance_tables(puzzles[-1])
+    assert puzzles[-1] not in Solver._distance_tables
+    Solver.clear_distance_tables()
+    assert not Solver._distance_tables